@@ -14,15 +14,31 @@ import numpy as np
 PathLike = Union[str, Path]
 
 
-def load_track_segment_bytes(session_dir: PathLike, segments: List[str]) -> bytes:
+def load_track_segment_bytes(session_dir: PathLike, segments: List[str]) -> bytearray:
     root = Path(session_dir)
-    parts = []
+    sized = []
     for name in segments:
         path = root / name
         if not path.is_file():
             raise FileNotFoundError(f"Missing capture segment: {path}")
-        parts.append(path.read_bytes())
-    return b"".join(parts)
+        sized.append((path, path.stat().st_size))
+    # Read every segment straight into one preallocated buffer instead of
+    # collecting per-segment bytes objects and copying them again in a join.
+    payload = bytearray(sum(size for _, size in sized))
+    filled = 0
+    with memoryview(payload) as view:
+        for path, size in sized:
+            # Each segment starts where the previous one actually ended, so a
+            # short read cannot leave a gap between segments.
+            end = filled + size
+            with open(path, "rb") as handle:
+                while filled < end:
+                    got = handle.readinto(view[filled:end])
+                    if not got:
+                        break
+                    filled += got
+    del payload[filled:]
+    return payload
 
 
 def load_track_pcm_array(
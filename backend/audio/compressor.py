@@ -10,7 +10,7 @@ import shutil
 import json
 from pathlib import Path
 
-from .constants import OPUS_BITRATE, OPUS_COMPRESSION_LEVEL, OPUS_APPLICATION
+from .constants import OPUS_BITRATE, OPUS_COMPRESSION_LEVEL, OPUS_APPLICATION, OPUS_NATIVE_SAMPLE_RATE
 
 
 def compress_to_opus(
@@ -22,6 +22,7 @@ def compress_to_opus(
     application: str | None = None,
     *,
     ffmpeg_path: str | None = None,
+    channels: int | None = None,
 ) -> str:
     """
     Compress audio to Opus format using ffmpeg.
@@ -34,6 +35,8 @@ def compress_to_opus(
         compression_level: 0-10, higher = better quality. Defaults to OPUS_COMPRESSION_LEVEL
         application: 'audio', 'voip', or 'lowdelay'. Defaults to OPUS_APPLICATION
         ffmpeg_path: Explicit ffmpeg executable. Defaults to ``ffmpeg`` on PATH.
+        channels: Output channel count written as ``-ac`` so the container
+            header does not depend on ffmpeg's layout guess. Omitted when None.
 
     Returns:
         Path to the output file (`.opus` on success, `.wav` fallback on failure)
@@ -61,6 +64,14 @@ def compress_to_opus(
     if lowered.endswith('.pcm.tmp') or lowered.endswith('.tmp'):
         input_format_args = ['-f', 'wav']
 
+    # Opus codes at 48 kHz internally; only ask for -ar when the caller wants
+    # something else, so a 48 kHz input skips libswresample entirely.
+    output_format_args = []
+    if sample_rate != OPUS_NATIVE_SAMPLE_RATE:
+        output_format_args += ['-ar', str(sample_rate)]
+    if channels is not None:
+        output_format_args += ['-ac', str(channels)]
+
     cmd = [
         ffmpeg_exe,
         *input_format_args,
@@ -70,7 +81,7 @@ def compress_to_opus(
         '-vbr', 'on',
         '-compression_level', str(compression_level),
         '-application', application,
-        '-ar', str(sample_rate),
+        *output_format_args,
         '-y',  # Overwrite output
         '-loglevel', 'error',
         opus_path
@@ -112,6 +123,7 @@ def compress_and_report(
     verify_again: bool = False,
     progress_message: str = "Compressing with ffmpeg (Opus codec)...",
     ffmpeg_path: str | None = None,
+    channels: int | None = None,
 ) -> tuple[str, dict]:
     """
     Compress a WAV to Opus and return the final path plus size stats.
@@ -125,6 +137,7 @@ def compress_and_report(
         output_path,
         sample_rate,
         ffmpeg_path=ffmpeg_path,
+        channels=channels,
     )
 
     input_size = Path(input_path).stat().st_size
@@ -51,6 +51,7 @@ NORMALIZED_DESKTOP_NAME = "normalized_desktop.f32.part"
 OPUS_BITRATE = '128k'  # Higher bitrate for archival/transcription quality
 OPUS_COMPRESSION_LEVEL = 10  # Maximum quality (0-10)
 OPUS_APPLICATION = 'audio'  # Audio mode (better quality than 'voip')
+OPUS_NATIVE_SAMPLE_RATE = 48000  # libopus always codes at 48 kHz internally
 
 # Watchdog
 WATCHDOG_CHECK_INTERVAL = 5  # seconds
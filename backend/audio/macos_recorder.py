@@ -26,6 +26,7 @@ from .capture_manifest import (
     mark_capture_discarded_and_cleanup,
 )
 from .track_spool import TrackSpool
+from .processor import peak_abs
 from .streaming_post_processor import FinalizationError, finalize_capture
 from .macos_desktop_diagnostics import (
     build_desktop_diagnostics,
@@ -177,6 +178,9 @@ class MacOSAudioRecorder:
         # Recording state
         self.is_running = False
         self._running_lock = threading.Lock()  # Protects is_running access
+        # Notified on every running-state change so capture loops wake on stop
+        # instead of sleeping out a polling interval.
+        self._running_changed = threading.Condition(self._running_lock)
         self.recording_failure = None
 
         # Durable capture spools ({stem}.capture/) — no whole-session RAM buffers.
@@ -809,7 +813,7 @@ class MacOSAudioRecorder:
 
                 # Calculate audio level (for visualization)
                 # Subsample by 8 for performance
-                level = np.max(np.abs(indata[::8]))
+                level = peak_abs(indata[::8])
 
                 with self.level_lock:
                     self.mic_level = float(level)
@@ -833,7 +837,7 @@ class MacOSAudioRecorder:
                 _send_event_message("mic_stream_opened", "Microphone stream opened")
 
                 while self._get_running():
-                    time.sleep(0.1)
+                    self._wait_while_running(0.1)
 
             committed = 0
             if self._mic_spool is not None:
@@ -926,12 +930,12 @@ class MacOSAudioRecorder:
                     level = None
                     latest = getattr(self.desktop_capture, "latest_audio_chunk", None)
                     if latest is not None:
-                        level = float(np.max(np.abs(latest[::8])))
+                        level = peak_abs(latest[::8])
                     else:
                         with self.desktop_capture.buffer_lock:
                             if self.desktop_capture.audio_buffer:
                                 latest_buffer = self.desktop_capture.audio_buffer[-1]
-                                level = float(np.max(np.abs(latest_buffer[::8])))
+                                level = peak_abs(latest_buffer[::8])
 
                     if level is not None:
                         with self.level_lock:
@@ -942,7 +946,7 @@ class MacOSAudioRecorder:
                         print(f"Warning: Error calculating desktop audio level: {level_err}", file=sys.stderr)
                         level_error_logged = True
 
-                time.sleep(0.1)
+                self._wait_while_running(0.1)
 
             print(f"Desktop recording thread stopped", file=sys.stderr)
 
@@ -1200,9 +1204,17 @@ class MacOSAudioRecorder:
             return self.is_running
 
     def _set_running(self, value: bool):
-        """Set the running state (thread-safe)."""
-        with self._running_lock:
+        """Set the running state (thread-safe) and wake threads waiting on it."""
+        with self._running_changed:
             self.is_running = value
+            self._running_changed.notify_all()
+
+    def _wait_while_running(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds, returning early on stop; return running state."""
+        with self._running_changed:
+            if self.is_running:
+                self._running_changed.wait(timeout)
+            return self.is_running
 
     def _get_running(self) -> bool:
         """Get the running state (thread-safe)."""
@@ -1389,7 +1401,7 @@ def main():
                 recorder._consume_desktop_helper_failure()
                 if not recorder.is_recording():
                     break
-                time.sleep(1)
+                stop_event.wait(1)
             finish_capture_from_stdin_or_duration()
         else:
             print(f"Recording... (send 'stop' or 'cancel' to stdin)", file=sys.stderr)
@@ -1422,7 +1434,8 @@ def main():
                     # Don't crash recording if visualization fails
                     print(f"Warning: Failed to send audio levels: {e}", file=sys.stderr)
 
-                time.sleep(0.2)  # 5 FPS updates (200ms interval)
+                # 5 FPS updates (200ms interval); wakes immediately on stop.
+                stop_event.wait(0.2)
 
             finish_capture_from_stdin_or_duration()
     except KeyboardInterrupt:
@@ -6,6 +6,8 @@ import sys
 
 import numpy as np
 
+from .processor import interleave_stereo, peak_abs
+
 
 def repair_one_sided_stereo(audio: np.ndarray, stream_name: str) -> np.ndarray:
     """Duplicate a dominant stereo channel so transcription downmixes do not lose speech.
@@ -18,10 +20,13 @@ def repair_one_sided_stereo(audio: np.ndarray, stream_name: str) -> np.ndarray:
 
     left = audio[:, 0]
     right = audio[:, 1]
-    left_rms = float(np.sqrt(np.mean(np.square(left)))) if left.size else 0.0
-    right_rms = float(np.sqrt(np.mean(np.square(right)))) if right.size else 0.0
-    left_peak = float(np.max(np.abs(left))) if left.size else 0.0
-    right_peak = float(np.max(np.abs(right))) if right.size else 0.0
+    # Sum of squares via dot: one pass per channel, no squared temporary
+    # (same reduction the streaming finalizer accumulates per chunk).
+    frames = left.size
+    left_rms = float(np.sqrt(np.dot(left, left) / frames))
+    right_rms = float(np.sqrt(np.dot(right, right) / frames))
+    left_peak = peak_abs(left)
+    right_peak = peak_abs(right)
 
     max_rms = max(left_rms, right_rms)
     min_rms = min(left_rms, right_rms)
@@ -40,4 +45,4 @@ def repair_one_sided_stereo(audio: np.ndarray, stream_name: str) -> np.ndarray:
         f"(left_rms={left_rms:.6f}, right_rms={right_rms:.6f})",
         file=sys.stderr,
     )
-    return np.column_stack([dominant, dominant])
+    return interleave_stereo(dominant, dominant, dtype=audio.dtype)
@@ -8,6 +8,7 @@ Electron parses these in the main process.
 from __future__ import annotations
 
 import json
+import sys
 import threading
 from typing import Any, Callable, Dict, Optional
 
@@ -16,9 +17,17 @@ _stdout_lock = threading.Lock()
 
 
 def send_json_message(message: Any, *, lock: Optional[threading.Lock] = None) -> None:
-    """Print one JSON control message to stdout (thread-safe)."""
+    """Print one JSON control message to stdout (thread-safe).
+
+    The line is encoded up front and handed to stdout as a single write plus
+    one flush, so a 200 ms levels tick costs one syscall pair instead of the
+    separate body/newline writes ``print`` issues.
+    """
+    line = json.dumps(message) + "\n"
     with lock or _stdout_lock:
-        print(json.dumps(message), flush=True)
+        stream = sys.stdout
+        stream.write(line)
+        stream.flush()
 
 
 def send_event_message(
@@ -10,10 +10,12 @@ Task 10 recovery.
 from __future__ import annotations
 
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
 from contextlib import ExitStack
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -33,12 +35,8 @@ from .constants import (
     DEFAULT_SAMPLE_RATE,
     FINAL_CAPTURE_PCM_NAME,
     MIC_BOOST_LINEAR,
-    NORMALIZATION_BOOST_TARGET,
-    NORMALIZATION_HIGH_THRESHOLD,
-    NORMALIZATION_LOW_THRESHOLD,
     NORMALIZED_DESKTOP_NAME,
     NORMALIZED_MIC_NAME,
-    SOFT_LIMIT_THRESHOLD,
 )
 from .macos_stereo_repair import repair_one_sided_stereo
 from .processor import (
@@ -47,7 +45,14 @@ from .processor import (
     apply_stereo_enhance_inplace,
     downmix_macos_frames_to_stereo,
     downmix_windows_frames_to_stereo,
+    float_to_int16_inplace,
+    int16_to_float32,
+    interleave_stereo,
+    normalization_gain,
+    pad_right,
+    peak_abs,
     plan_stereo_enhance,
+    soft_limit_inplace,
 )
 from .wav_io import probe_wav_pcm_geometry
 
@@ -239,13 +244,9 @@ def _emit_progress(callback: ProgressCallback, stage: str, message: str) -> None
         pass
 
 
-def _int16_frames_to_float(frames: np.ndarray) -> np.ndarray:
-    return frames.astype(np.float32) / 32768.0
-
-
 def _float_stereo_to_int16_interleaved(frames: np.ndarray) -> np.ndarray:
-    clipped = np.clip(frames, -1.0, 1.0)
-    return (clipped * 32767.0).astype(np.int16).reshape(-1)
+    # One float32 working copy; clip/scale happen in place inside it.
+    return float_to_int16_inplace(np.array(frames, dtype=np.float32)).reshape(-1)
 
 
 def _accumulate_stereo_stats(
@@ -261,8 +262,11 @@ def _accumulate_stereo_stats(
         left = data[:, 0]
         right = left
     else:
-        left = data[:, 0]
-        right = data[:, 1]
+        # Deinterleave once into contiguous planes: the eight reductions below
+        # then run on unit-stride memory instead of walking stride-2 views.
+        planar = np.ascontiguousarray(data[:, :2].T)
+        left = planar[0]
+        right = planar[1]
     stats.frames += int(data.shape[0])
     stats.channels = 2
     stats.sum_left += float(left.sum())
@@ -293,16 +297,8 @@ def _plan_stereo_enhance_from_stats(
         # float32 channel, so preserve that rounding before deriving extrema.
         mean = float(np.float32(total / stats.frames))
         peak = max(abs(minimum - mean), abs(maximum - mean))
-        scale = 1.0
-        if peak > NORMALIZATION_HIGH_THRESHOLD:
-            scale = NORMALIZATION_HIGH_THRESHOLD / peak
-        elif 0 < peak < NORMALIZATION_LOW_THRESHOLD:
-            scale = NORMALIZATION_BOOST_TARGET / peak
-        return ChannelEnhancePlan(
-            mean=mean,
-            scale=scale,
-            soft_limit=(peak * scale) > SOFT_LIMIT_THRESHOLD,
-        )
+        scale, soft_limit = normalization_gain(peak)
+        return ChannelEnhancePlan(mean=mean, scale=scale, soft_limit=soft_limit)
 
     return (
         _plan(stats.sum_left, stats.min_left, stats.max_left),
@@ -332,16 +328,28 @@ def _apply_one_sided(frames: np.ndarray, decision: _OneSidedDecision) -> np.ndar
     if not decision.repair or frames.size == 0:
         return frames
     dominant = frames[:, 0] if decision.dominant_left else frames[:, 1]
-    return np.column_stack([dominant, dominant])
+    return interleave_stereo(dominant, dominant, dtype=frames.dtype)
 
 
 def _write_float32_chunk(path: Path, frames: np.ndarray, *, append: bool) -> None:
     mode = "ab" if append else "wb"
     with open(path, mode) as handle:
-        handle.write(np.ascontiguousarray(frames, dtype=np.float32).tobytes())
+        handle.write(np.ascontiguousarray(frames, dtype=np.float32))
 
 
-def _read_float32_stereo_chunk(source: Any, start_frame: int, frame_count: int) -> np.ndarray:
+def _read_float32_stereo_chunk(
+    source: Any,
+    start_frame: int,
+    frame_count: int,
+    *,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Read up to ``frame_count`` stereo float32 frames at ``start_frame``.
+
+    With ``out`` (a C-contiguous ``(>= frame_count, 2)`` float32 buffer) the
+    bytes are read straight into it and a view of the filled rows is returned,
+    so callers can recycle one scratch buffer across chunks.
+    """
     if frame_count <= 0:
         return np.zeros((0, 2), dtype=np.float32)
     frame_bytes = 2 * 4
@@ -351,6 +359,10 @@ def _read_float32_stereo_chunk(source: Any, start_frame: int, frame_count: int)
         byte_offset = start_frame * frame_bytes
         if handle.tell() != byte_offset:
             handle.seek(byte_offset)
+        if out is not None:
+            target = out[:frame_count]
+            got_bytes = handle.readinto(memoryview(target).cast("B")) or 0
+            return target[: got_bytes // frame_bytes]
         payload = handle.read(frame_count * frame_bytes)
     finally:
         if owns_handle:
@@ -385,13 +397,21 @@ def _normalize_track_to_stereo_file(
 
     written = 0
     stats = _TrackStats()
-    resampler = StatefulResampler(sample_rate, target_rate, channels, quality="VHQ")
+    # windows-v1 keeps only the front pair of a multichannel device. soxr
+    # filters each channel independently, so dropping the rest *before* the
+    # resampler is bit-identical and skips designing/running their filters.
+    resample_channels = 2 if profile == "windows-v1" and channels > 2 else channels
+    resampler = StatefulResampler(sample_rate, target_rate, resample_channels, quality="VHQ")
     downmix = (
         downmix_windows_frames_to_stereo
         if profile == "windows-v1"
         else downmix_macos_frames_to_stereo
     )
     committed = int(track.get("committedFrames") or 0)
+    # Loop-invariant per track: decide the int16 path and bind the per-chunk
+    # callables once instead of re-evaluating them for every window.
+    is_int16 = dtype in ("<i2", "int16")
+    process = resampler.process
 
     with (
         TrackFrameReader(
@@ -412,25 +432,25 @@ def _normalize_track_to_stereo_file(
                 if written == 0 and not pending_flush:
                     break
                 float_in = (
-                    np.zeros((0, channels), dtype=np.float32)
-                    if channels > 1
+                    np.zeros((0, resample_channels), dtype=np.float32)
+                    if resample_channels > 1
                     else np.zeros(0, dtype=np.float32)
                 )
                 last = True
             else:
                 pending_flush = True
-                if dtype in ("<i2", "int16"):
-                    float_in = _int16_frames_to_float(raw)
+                if resample_channels != channels:
+                    raw = raw[:, :resample_channels]
+                if is_int16:
+                    float_in = int16_to_float32(raw)
                 else:
                     float_in = raw.astype(np.float32, copy=False)
                 last = False
 
-            resampled = resampler.process(float_in, last=last)
+            resampled = process(float_in, last=last)
             if resampled.size:
-                stereo = downmix(resampled, channels)
-                output_handle.write(
-                    np.ascontiguousarray(stereo, dtype=np.float32).tobytes()
-                )
+                stereo = downmix(resampled, resample_channels)
+                output_handle.write(np.ascontiguousarray(stereo, dtype=np.float32))
                 _accumulate_stereo_stats(stats, stereo)
                 written += int(stereo.shape[0])
             if last:
@@ -447,8 +467,27 @@ def _normalize_track_to_stereo_file(
 
 def _mix_soft_limit_inplace(mixed: np.ndarray, *, apply: bool) -> None:
     if apply and mixed.size:
-        mixed *= 0.85
-        np.tanh(mixed, out=mixed)
+        soft_limit_inplace(mixed, pre_gain=0.85)
+
+
+def _mix_chunk_inplace(
+    mic_chunk: np.ndarray,
+    desk_chunk: np.ndarray,
+    *,
+    mic_gain: float,
+    desktop_gain: float,
+    apply_limit: bool,
+) -> np.ndarray:
+    """Scale, sum and soft-limit into ``mic_chunk`` without float temporaries.
+
+    Both chunks must be owned by the caller; ``desk_chunk`` is scaled in place.
+    Same operation order as ``mic * g + desk * d`` so output is bit-identical.
+    """
+    mic_chunk *= mic_gain
+    desk_chunk *= desktop_gain
+    mic_chunk += desk_chunk
+    _mix_soft_limit_inplace(mic_chunk, apply=apply_limit)
+    return mic_chunk
 
 
 def _iter_aligned_mix_chunks(
@@ -478,6 +517,9 @@ def _iter_aligned_mix_chunks(
     desk_pos = desk_trim
     out_pos = 0
     desk_kept = max(0, desk_frames - desk_trim) if include_desktop else 0
+    desk_end = desk_trim + desk_kept
+    # Fold the volume/boost scalars once; each chunk then pays one multiply pass.
+    mic_gain = mic_volume * mic_boost
     with ExitStack() as stack:
         mic_handle = stack.enter_context(open(mic_path, "rb"))
         desk_handle = (
@@ -485,11 +527,15 @@ def _iter_aligned_mix_chunks(
             if include_desktop and desk_path is not None
             else None
         )
+        # The desktop chunk is folded into the mic chunk before each yield, so
+        # one scratch buffer serves every chunk of the pass.
+        desk_scratch = (
+            np.empty((chunk_frames, 2), dtype=np.float32) if desk_handle is not None else None
+        )
         while out_pos < total_frames:
             n = min(chunk_frames, total_frames - out_pos)
             if n > chunk_frames:
                 raise ValueError("Rejecting oversize aligned mix chunk")
-            mic_chunk = np.zeros((n, 2), dtype=np.float32)
             local = 0
             if out_pos < mic_pad:
                 local = min(n, mic_pad - out_pos)
@@ -505,36 +551,56 @@ def _iter_aligned_mix_chunks(
                 got = _apply_one_sided(got, mic_one_sided)
                 if mic_enhance is not None:
                     apply_stereo_enhance_inplace(got, mic_enhance[0], mic_enhance[1])
-                mic_chunk[local : local + got.shape[0]] = got
+                if local == 0 and got.shape[0] == n:
+                    # Chunk is all real samples: the freshly read buffer is ours,
+                    # so skip the zero-fill + copy into a separate output chunk.
+                    mic_chunk = got
+                else:
+                    mic_chunk = np.zeros((n, 2), dtype=np.float32)
+                    mic_chunk[local : local + got.shape[0]] = got
                 mic_pos += got.shape[0]
-            elif mic_one_sided.repair:
+            else:
                 # Pad-only chunk: zeros stay zeros under one-sided repair.
-                mic_chunk = _apply_one_sided(mic_chunk, mic_one_sided)
+                mic_chunk = np.zeros((n, 2), dtype=np.float32)
 
             if include_desktop and desk_handle is not None:
-                desk_chunk = np.zeros((n, 2), dtype=np.float32)
+                desk_chunk = desk_scratch[:n]
                 dlocal = 0
                 if out_pos < desk_pad:
                     dlocal = min(n, desk_pad - out_pos)
                 dtake = n - dlocal
-                if dtake > 0 and desk_pos < desk_trim + desk_kept:
+                filled = dlocal
+                if dtake > 0 and desk_pos < desk_end:
                     got = _read_float32_stereo_chunk(
                         desk_handle,
                         desk_pos,
-                        min(dtake, desk_trim + desk_kept - desk_pos),
+                        min(dtake, desk_end - desk_pos),
+                        out=desk_chunk[dlocal:],
                     )
                     if got.shape[0] > chunk_frames:
                         raise ValueError("Rejecting oversize desktop chunk read")
-                    desk_chunk[dlocal : dlocal + got.shape[0]] = got
                     desk_pos += got.shape[0]
+                    filled += got.shape[0]
+                # Zero only the alignment pad and the tail past the real samples.
+                desk_chunk[:dlocal] = 0.0
+                desk_chunk[filled:] = 0.0
                 desk_chunk = _apply_one_sided(desk_chunk, desk_one_sided)
-                mixed = mic_chunk * (mic_volume * mic_boost) + desk_chunk * desktop_volume
-                _mix_soft_limit_inplace(mixed, apply=apply_mix_limit)
+                mixed = _mix_chunk_inplace(
+                    mic_chunk,
+                    desk_chunk,
+                    mic_gain=mic_gain,
+                    desktop_gain=desktop_volume,
+                    apply_limit=apply_mix_limit,
+                )
             elif profile == "windows-v1":
                 # Windows mic-only: enhance already applied; no extra volume multiply.
                 mixed = mic_chunk
             else:
-                mixed = mic_chunk * mic_volume
+                # In-place float32 scale (no upcast/clip temporaries); unity
+                # volume — the default — skips the pass entirely.
+                if mic_volume != 1.0:
+                    mic_chunk *= mic_volume
+                mixed = mic_chunk
 
             if post_mix_enhance is not None:
                 apply_stereo_enhance_inplace(mixed, post_mix_enhance[0], post_mix_enhance[1])
@@ -561,8 +627,14 @@ def _compute_mix_peak_aligned(
     mic_one_sided: _OneSidedDecision,
     desk_one_sided: _OneSidedDecision,
     mic_enhance: Optional[tuple[ChannelEnhancePlan, ChannelEnhancePlan]],
+    stats: Optional[_TrackStats] = None,
 ) -> float:
-    """Peak of the aligned mix *before* soft limiting (to decide whether to limit)."""
+    """Peak of the aligned mix *before* soft limiting (to decide whether to limit).
+
+    When ``stats`` is given, sum/min/max of the same unlimited chunks are
+    accumulated into it, so a caller that ends up not limiting can reuse them
+    instead of running another full mix pass.
+    """
     peak = 0.0
     for mixed in _iter_aligned_mix_chunks(
         mic_path=mic_path,
@@ -585,12 +657,9 @@ def _compute_mix_peak_aligned(
         apply_mix_limit=False,
         post_mix_enhance=None,
     ):
-        if mixed.size:
-            peak = max(
-                peak,
-                abs(float(mixed.min())),
-                abs(float(mixed.max())),
-            )
+        peak = max(peak, peak_abs(mixed))
+        if stats is not None:
+            _accumulate_stereo_stats(stats, mixed, include_energy=False)
     return peak
 
 
@@ -620,6 +689,33 @@ def _aligned_frame_count(
     return mic_pad, desk_pad, max(mic_total, desk_total)
 
 
+# Mixed chunks buffered between the mix loop and the ffmpeg pipe writer.
+# Bounded (blocking, never dropping) so memory stays at a few chunks.
+_FFMPEG_PIPE_QUEUE_CHUNKS = 4
+
+
+def _pipe_chunks_to_stdin(
+    stdin: Any,
+    chunks: "queue.Queue[Optional[np.ndarray]]",
+    errors: List[BaseException],
+) -> None:
+    """Writer-thread body: drain ``chunks`` into ``stdin`` until the ``None`` sentinel.
+
+    After a write error the queue keeps draining (without writing) so the
+    producer never blocks on a full queue; the error is left in ``errors``.
+    """
+    while True:
+        chunk = chunks.get()
+        if chunk is None:
+            return
+        if errors:
+            continue
+        try:
+            stdin.write(chunk)
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the producer
+            errors.append(exc)
+
+
 def _stream_final_wav_via_ffmpeg(
     *,
     ffmpeg_path: str,
@@ -665,13 +761,34 @@ def _stream_final_wav_via_ffmpeg(
     assert proc.stdin is not None
     written = 0
     stderr_bytes = b""
+    # Pipe writes happen on their own thread so the next chunk is read and
+    # mixed while ffmpeg drains the previous one.
+    chunks: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=_FFMPEG_PIPE_QUEUE_CHUNKS)
+    write_errors: List[BaseException] = []
+    writer = threading.Thread(
+        target=_pipe_chunks_to_stdin,
+        args=(proc.stdin, chunks, write_errors),
+        name="finalize-ffmpeg-pipe",
+        daemon=True,
+    )
+    writer.start()
     try:
         try:
-            for chunk in frame_iter:
-                if chunk.size == 0:
-                    continue
-                proc.stdin.write(np.ascontiguousarray(chunk, dtype=np.float32).tobytes())
-                written += int(chunk.shape[0])
+            try:
+                for chunk in frame_iter:
+                    if write_errors:
+                        break
+                    if chunk.size == 0:
+                        continue
+                    # Mix chunks are freshly allocated per yield, so the writer
+                    # can own them; the array buffer is written without .tobytes().
+                    chunks.put(np.ascontiguousarray(chunk, dtype=np.float32))
+                    written += int(chunk.shape[0])
+            finally:
+                chunks.put(None)
+                writer.join()
+            if write_errors:
+                raise write_errors[0]
             proc.stdin.close()
             proc.wait(timeout=600)
         except Exception:
@@ -901,6 +1018,15 @@ def _copy_recoverable_wav(
         return None
 
 
+def _unlink_files_quietly(paths: List[Path]) -> None:
+    for path in paths:
+        try:
+            if path.is_file():
+                path.unlink()
+        except OSError:
+            pass
+
+
 def cleanup_completed_capture_session(session_dir: PathLike) -> None:
     """Idempotent removal of a completed capture directory and intermediates."""
     root = Path(session_dir)
@@ -1012,20 +1138,13 @@ def reference_macos_v1_process(
         mic_f = repair_one_sided_stereo(mic_f, "microphone")
         desk_f = repair_one_sided_stereo(desk_f, "desktop")
         target = max(len(mic_f), len(desk_f))
-        if len(mic_f) < target:
-            mic_f = np.concatenate(
-                [mic_f, np.zeros((target - len(mic_f), 2), dtype=np.float32)], axis=0
-            )
-        if len(desk_f) < target:
-            desk_f = np.concatenate(
-                [desk_f, np.zeros((target - len(desk_f), 2), dtype=np.float32)], axis=0
-            )
+        mic_f = pad_right(mic_f, target)
+        desk_f = pad_right(desk_f, target)
         final = mic_f * (mic_volume * mic_boost)
-        final = final + desk_f * desktop_volume
-        max_val = max(abs(float(final.min())), abs(float(final.max()))) if final.size else 0.0
+        final += desk_f * desktop_volume
+        max_val = peak_abs(final)
         if max_val > 1.0:
-            final = final * 0.85
-            np.tanh(final, out=final)
+            soft_limit_inplace(final, pre_gain=0.85)
 
     left_plan, right_plan = plan_stereo_enhance(final)
     apply_stereo_enhance_inplace(final, left_plan, right_plan)
@@ -1181,6 +1300,9 @@ def finalize_capture(
 
         _emit_progress(progress_callback, "audio_mixing", "Mixing audio...")
         mix_peak = 0.0
+        # macOS needs post-mix stats; gather them during the peak pass and reuse
+        # them when no limiting turns out to be needed (the common case).
+        unlimited_mix_stats = _TrackStats() if profile == "macos-v1" else None
         if include_desktop:
             mix_peak = _compute_mix_peak_aligned(
                 mic_path=mic_path,
@@ -1200,6 +1322,7 @@ def finalize_capture(
                 mic_one_sided=mic_one_sided,
                 desk_one_sided=desk_one_sided,
                 mic_enhance=mic_enhance,
+                stats=unlimited_mix_stats,
             )
         apply_mix_limit = include_desktop and mix_peak > 1.0
 
@@ -1232,8 +1355,12 @@ def finalize_capture(
                     post_mix_enhance=None,
                 )
 
-            for mixed in _iter_mixed_for_stats():
-                _accumulate_stereo_stats(mixed_stats, mixed, include_energy=False)
+            if include_desktop and not apply_mix_limit:
+                # Unlimited mix == the mix the stats pass would rebuild.
+                mixed_stats = unlimited_mix_stats
+            else:
+                for mixed in _iter_mixed_for_stats():
+                    _accumulate_stereo_stats(mixed_stats, mixed, include_energy=False)
             post_mix_enhance = _plan_stereo_enhance_from_stats(mixed_stats)
 
         final_temp = coordinator.session_dir / FINAL_CAPTURE_PCM_NAME
@@ -1277,16 +1404,38 @@ def finalize_capture(
             raise FinalizationError(str(verify_exc), recoverable_path=promoted) from verify_exc
 
         geometry = probe_wav_pcm_geometry(final_temp) or {}
-        duration = float(geometry.get("frames", written_frames)) / float(TARGET_RATE)
-
-        _emit_progress(progress_callback, "audio_encoding", "Encoding audio...")
-        final_path, compress_stats = compress_and_report(
-            str(final_temp),
-            str(output_path),
-            TARGET_RATE,
-            ffmpeg_path=ffmpeg_path,
-            progress_message="Compressing with ffmpeg (Opus codec)...",
+        # Stereo frames, not interleaved samples: an integer count, so the
+        # duration is one exact division (and the same count feeds the stats).
+        final_frames = int(geometry.get("frames", written_frames))
+        duration = final_frames / TARGET_RATE
+
+        # The verified final temp supersedes the normalized intermediates (they
+        # are rebuilt from committed segments on recovery), so drop them while
+        # ffmpeg encodes rather than after it: multi-GB unlinks are not free.
+        discard_intermediates = threading.Thread(
+            target=_unlink_files_quietly,
+            args=(
+                [
+                    coordinator.session_dir / NORMALIZED_MIC_NAME,
+                    coordinator.session_dir / NORMALIZED_DESKTOP_NAME,
+                ],
+            ),
+            name="finalize-discard-intermediates",
+            daemon=True,
         )
+        discard_intermediates.start()
+        _emit_progress(progress_callback, "audio_encoding", "Encoding audio...")
+        try:
+            final_path, compress_stats = compress_and_report(
+                str(final_temp),
+                str(output_path),
+                TARGET_RATE,
+                ffmpeg_path=ffmpeg_path,
+                progress_message="Compressing with ffmpeg (Opus codec)...",
+                channels=2,
+            )
+        finally:
+            discard_intermediates.join()
         # Require a real decode of the meeting output before deleting recovery inputs.
         if not ffmpeg_can_decode(final_path, ffmpeg_path):
             promoted = _copy_recoverable_wav(
@@ -1321,13 +1470,12 @@ def finalize_capture(
         coordinator.set_state("complete")
 
         # Transactional cleanup only after verified completion.
-        for name in (NORMALIZED_MIC_NAME, NORMALIZED_DESKTOP_NAME, FINAL_CAPTURE_PCM_NAME):
-            path = coordinator.session_dir / name
-            try:
-                if path.is_file():
-                    path.unlink()
-            except OSError:
-                pass
+        _unlink_files_quietly(
+            [
+                coordinator.session_dir / name
+                for name in (NORMALIZED_MIC_NAME, NORMALIZED_DESKTOP_NAME, FINAL_CAPTURE_PCM_NAME)
+            ]
+        )
         for track_name in list(data.get("tracks", {})):
             track = coordinator.get_track(track_name)
             for segment in track.get("segments") or []:
@@ -1353,7 +1501,7 @@ def finalize_capture(
             recovered=recovered,
             stats={
                 "processingProfile": profile,
-                "frames": int(geometry.get("frames", written_frames)),
+                "frames": final_frames,
                 "includeDesktop": include_desktop,
                 "compress": compress_stats,
             },
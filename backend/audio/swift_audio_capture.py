@@ -22,6 +22,7 @@ import numpy as np
 from pathlib import Path
 from typing import Optional, Callable
 
+from .processor import peak_abs
 from .swift_helper_status import apply_helper_error, process_helper_status_line
 from .swift_pcm_alignment import SwiftPcmAligner
 
@@ -445,7 +446,7 @@ class SwiftAudioCapture:
                     continue
 
                 # Add to buffer or optional sink (thread-safe)
-                chunk_peak = float(np.max(np.abs(audio_data))) if audio_data.size else 0.0
+                chunk_peak = peak_abs(audio_data)
                 if not self._ingest_audio_chunk(audio_data, chunk_peak=chunk_peak):
                     break
 
@@ -479,7 +480,7 @@ class SwiftAudioCapture:
                         if audio_data is None:
                             continue
 
-                        chunk_peak = float(np.max(np.abs(audio_data))) if audio_data.size else 0.0
+                        chunk_peak = peak_abs(audio_data)
                         if not self._ingest_audio_chunk(audio_data, chunk_peak=chunk_peak):
                             break
                         total_samples += len(audio_data)
@@ -854,14 +855,9 @@ if __name__ == "__main__":
         print(f"  Duration: {len(audio) / 48000:.2f} seconds")
         print(f"  Max amplitude: {np.max(np.abs(audio)):.4f}")
 
-        # Save to WAV for testing
-        import wave
-        audio_int16 = (audio * 32767).astype(np.int16)
-        with wave.open("test_swift_capture.wav", 'wb') as wf:
-            wf.setnchannels(2)
-            wf.setsampwidth(2)
-            wf.setframerate(48000)
-            wf.writeframes(audio_int16.tobytes())
+        # Save to WAV for testing (block-wise writer: no full int16/bytes copy)
+        from .wav_io import write_float_stereo_wav
+        write_float_stereo_wav("test_swift_capture.wav", audio, sample_rate=48000, log=False)
         print(f"\nSaved to test_swift_capture.wav")
     else:
         print("No audio captured")
@@ -117,7 +117,10 @@ class TrackSpool:
         self._clock = clock
         self._close_join_timeout_s = close_join_timeout_s
 
-        self._queue: queue.Queue[Optional[tuple[bytes, Optional[int]]]] = queue.Queue()
+        # SimpleQueue is the C-level unbounded FIFO: put_nowait from the audio
+        # callback takes no Condition/mutex round-trip, unlike queue.Queue.
+        # Byte bounding stays in ``_queued_bytes`` below.
+        self._queue: queue.SimpleQueue[Optional[tuple[bytes, Optional[int]]]] = queue.SimpleQueue()
         self._queued_bytes = 0
         self._queued_lock = threading.Lock()
         # Set when the queue transitions empty→nonempty; cleared when drained.
@@ -222,7 +225,7 @@ class TrackSpool:
 
         try:
             self._queue.put_nowait((payload, frame_position))
-        except queue.Full:
+        except Exception:  # noqa: BLE001 - unbounded put; only allocation can fail
             with self._queued_lock:
                 self._queued_bytes = max(0, self._queued_bytes - len(payload))
                 if self._queued_bytes <= 0:
@@ -14,6 +14,10 @@ from .constants import FINAL_CAPTURE_PCM_NAME
 
 PathLike = Union[str, Path]
 
+# Frames converted per block when writing float audio; bounds the int16
+# temporary to ~256 KiB instead of a second full-length copy.
+_WAV_WRITE_BLOCK_FRAMES = 65536
+
 __all__ = [
     "FINAL_CAPTURE_PCM_NAME",
     "write_int16_pcm_wav",
@@ -36,7 +40,8 @@ def write_int16_pcm_wav(
     ``pcm`` may be a flat/interleaved int16 ndarray (Windows mix output) or raw bytes.
     """
     output = str(path)
-    frames = pcm.tobytes() if isinstance(pcm, np.ndarray) else pcm
+    # wave accepts any C-contiguous buffer; skip the full-size tobytes() copy.
+    frames = np.ascontiguousarray(pcm) if isinstance(pcm, np.ndarray) else pcm
     with wave.open(output, 'wb') as wf:
         wf.setnchannels(channels)
         wf.setsampwidth(sample_width)
@@ -58,16 +63,19 @@ def write_float_stereo_wav(
     Mono input is duplicated to stereo. Matches the previous macOS ``_save_wav`` behavior.
     """
     output = str(path)
-    if len(audio.shape) == 1:
-        audio = np.column_stack([audio, audio])
-
-    audio_int = np.clip(audio * 32767, -32768, 32767).astype(np.int16)
+    mono = len(audio.shape) == 1
 
+    # Convert and write block by block so peak memory stays at one block rather
+    # than full-length scaled/int16 copies; close() patches the RIFF sizes.
     with wave.open(output, 'wb') as wf:
         wf.setnchannels(2)
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
-        wf.writeframes(audio_int.tobytes())
+        for start in range(0, len(audio), _WAV_WRITE_BLOCK_FRAMES):
+            block = audio[start:start + _WAV_WRITE_BLOCK_FRAMES]
+            if mono:
+                block = np.column_stack([block, block])
+            wf.writeframesraw(np.clip(block * 32767, -32768, 32767).astype(np.int16))
 
     if log:
         print(f"Saved WAV: {output}", file=sys.stderr)
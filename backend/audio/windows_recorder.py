@@ -95,6 +95,7 @@ from .track_spool import (
     DEFAULT_STALL_TIMEOUT_S,
     TrackSpool,
 )
+from .processor import peak_abs
 from .streaming_post_processor import FinalizationError, finalize_capture
 
 # Bound desktop PCM deferred until mic_first_capture_time exists (matches spool queue).
@@ -106,6 +107,24 @@ DEFERRED_DESKTOP_MAX_WAIT_S = DEFAULT_STALL_TIMEOUT_S
 _final_output_path = None
 _recording_duration = 0.0
 
+
+def _int16_buffer_level(in_data) -> float:
+    """Meter level (0..1) from every LEVEL_SUBSAMPLE_FACTOR-th sample of a PyAudio buffer.
+
+    Builds one strided int16 view straight over the callback bytes instead of a
+    ``frombuffer`` array plus a second sliced view on every tick.
+    """
+    samples = len(in_data) // 2
+    count = (samples + LEVEL_SUBSAMPLE_FACTOR - 1) // LEVEL_SUBSAMPLE_FACTOR
+    view = np.ndarray(
+        (count,),
+        dtype=np.int16,
+        buffer=in_data,
+        strides=(2 * LEVEL_SUBSAMPLE_FACTOR,),
+    )
+    return peak_abs(view) / 32768.0
+
+
 # Capture always spills to durable ``{stem}.capture/`` track spools during
 # recording. Stop finalizes via bounded ``finalize_capture`` (no whole-session
 # RAM mix). Interrupted sessions recover via ``audio.capture_recovery``.
@@ -176,16 +195,20 @@ class AudioRecorder:
             # Many modern USB mics support 48kHz even if default is 16kHz
             # This avoids quality-degrading resampling
             default_rate = int(mic_info['defaultSampleRate'])
-
-            # Try to use 48kHz if device supports it, otherwise use native rate
-            # This matches Google Meet's approach
-            if default_rate < 48000 and sample_rate == 48000:
+            # Kept so the open fallback in start_recording needs no second query.
+            self.mic_default_sample_rate = default_rate
+
+            # Try to open at 48kHz whenever the device default differs (up or
+            # down): the driver converts, so 96kHz mics no longer spool twice
+            # the bytes only to be resampled at finalize. Falls back to the
+            # native rate if the open fails. This matches Google Meet's approach
+            if default_rate != sample_rate and sample_rate == 48000:
                 print(f"Mic default rate is {default_rate} Hz, will attempt to use {sample_rate} Hz", file=sys.stderr)
                 self.mic_sample_rate = sample_rate  # Try requested rate
-                self.mic_requested_higher_rate = True
+                self.mic_requested_target_rate = True
             else:
                 self.mic_sample_rate = default_rate
-                self.mic_requested_higher_rate = False
+                self.mic_requested_target_rate = False
 
             self.mic_channels = int(mic_info['maxInputChannels'])
 
@@ -261,6 +284,14 @@ class AudioRecorder:
         self.mic_frame_count = 0
         self.desktop_frame_count = 0
         self.mic_total_bytes = 0
+        # PortAudio status flags OR-ed together by the callbacks since the last
+        # report; the watchdog prints them so callbacks never write to stderr.
+        # _status_lock keeps a flag raised mid-report from being lost in the reset.
+        self._status_lock = threading.Lock()
+        self.mic_status_flags = 0
+        self.mic_status_callbacks = 0
+        self.desktop_status_flags = 0
+        self.desktop_status_callbacks = 0
 
         # Time-based synchronization - SINGLE reference point set at recording start
         # Both streams use the same reference to ensure they stay in sync
@@ -374,7 +405,11 @@ class AudioRecorder:
         self.last_mic_callback_time = current_time
 
         if status:
-            print(f"Mic status: {status}", file=sys.stderr)
+            # Counted here and reported by the watchdog: no stderr I/O on the
+            # realtime PortAudio thread.
+            with self._status_lock:
+                self.mic_status_flags |= status
+                self.mic_status_callbacks += 1
 
         if self.is_recording:
             self.mic_frame_count += 1
@@ -391,9 +426,7 @@ class AudioRecorder:
 
             # Calculate level for visualization (subsampled for performance)
             try:
-                data = np.frombuffer(in_data, dtype=np.int16)
-                peak = np.abs(data[::LEVEL_SUBSAMPLE_FACTOR]).max() if len(data) > 0 else 0
-                self.mic_level = float(peak) / 32768.0
+                self.mic_level = _int16_buffer_level(in_data)
             except Exception:
                 self.mic_level = 0.0
 
@@ -425,13 +458,27 @@ class AudioRecorder:
 
         return (in_data, pyaudio.paContinue)
 
+    def _report_callback_status(self):
+        """Print and reset PortAudio status flags collected by the callbacks."""
+        with self._status_lock:
+            mic_callbacks, self.mic_status_callbacks = self.mic_status_callbacks, 0
+            mic_flags, self.mic_status_flags = self.mic_status_flags, 0
+            desktop_callbacks, self.desktop_status_callbacks = self.desktop_status_callbacks, 0
+            desktop_flags, self.desktop_status_flags = self.desktop_status_flags, 0
+        if mic_callbacks:
+            print(f"Mic status: {mic_flags} ({mic_callbacks} callback(s))", file=sys.stderr)
+        if desktop_callbacks:
+            print(f"Desktop status: {desktop_flags} ({desktop_callbacks} callback(s))", file=sys.stderr)
+
     def _desktop_callback(self, in_data, frame_count, time_info, status):
         """Callback for desktop audio."""
         current_time = time.time()
         self.last_desktop_callback_time = current_time
 
         if status:
-            print(f"Desktop status: {status}", file=sys.stderr)
+            with self._status_lock:
+                self.desktop_status_flags |= status
+                self.desktop_status_callbacks += 1
 
         if self.is_recording:
             self.desktop_frame_count += 1
@@ -448,9 +495,7 @@ class AudioRecorder:
 
             # Calculate level for visualization (subsampled for performance)
             try:
-                data = np.frombuffer(in_data, dtype=np.int16)
-                peak = np.abs(data[::LEVEL_SUBSAMPLE_FACTOR]).max() if len(data) > 0 else 0
-                self.desktop_level = float(peak) / 32768.0
+                self.desktop_level = _int16_buffer_level(in_data)
             except Exception:
                 self.desktop_level = 0.0
 
@@ -853,6 +898,11 @@ class AudioRecorder:
         self.mic_frame_count = 0
         self.desktop_frame_count = 0
         self.mic_total_bytes = 0
+        with self._status_lock:
+            self.mic_status_flags = 0
+            self.mic_status_callbacks = 0
+            self.desktop_status_flags = 0
+            self.desktop_status_callbacks = 0
         self.is_recording = True
         self.mic_watchdog_warning_shown = False
         self.desktop_watchdog_warning_shown = False
@@ -895,7 +945,7 @@ class AudioRecorder:
             self.mic_stream = self.pa.open(
                 format=pyaudio.paInt16,
                 channels=self.mic_channels,
-                rate=self.mic_sample_rate,  # Try higher quality rate
+                rate=self.mic_sample_rate,  # Try the target rate first
                 input=True,
                 input_device_index=self.mic_device_id,
                 frames_per_buffer=self.chunk_size,
@@ -906,10 +956,9 @@ class AudioRecorder:
             _send_event_message("mic_stream_opened", "Microphone stream opened")
         except Exception as e:
             # If higher rate failed, try falling back to device default
-            if self.mic_requested_higher_rate:
+            if self.mic_requested_target_rate:
                 print(f"  Warning: {self.mic_sample_rate} Hz not supported, trying device default...", file=sys.stderr)
-                mic_info = self.pa.get_device_info_by_index(self.mic_device_id)
-                self.mic_sample_rate = int(mic_info['defaultSampleRate'])
+                self.mic_sample_rate = self.mic_default_sample_rate
                 try:
                     self.mic_stream = self.pa.open(
                         format=pyaudio.paInt16,
@@ -973,6 +1022,7 @@ class AudioRecorder:
 
             while self.is_recording and self.watchdog_running:
                 time.sleep(WATCHDOG_CHECK_INTERVAL)
+                self._report_callback_status()
 
                 if self.is_recording:
                     stall_state = evaluate_callback_stalls(
@@ -1042,6 +1092,7 @@ class AudioRecorder:
 
         # Stop streams
         self._close_streams()
+        self._report_callback_status()
 
         print(f"Streams stopped", file=sys.stderr)
         try:
@@ -1236,7 +1287,7 @@ def main():
             for i in range(args.duration):
                 if not recorder.is_recording or stop_event.is_set() or recorder.get_async_capture_error():
                     break
-                time.sleep(1)
+                stop_event.wait(1)
             if stdin_command["cmd"] == RECORDER_STDIN_CANCEL:
                 recorder.cancel_recording()
                 recording_cancelled = True
@@ -1264,7 +1315,9 @@ def main():
                     "desktop": round(recorder.desktop_level, 3)
                 }
                 _send_json_message(levels)
-                time.sleep(0.2) # 5 FPS updates (was 0.05 = 20 FPS)
+                # 5 FPS updates (was 0.05 = 20 FPS). Event wait, not sleep, so
+                # a stop/cancel from stdin breaks out immediately.
+                stop_event.wait(0.2)
             
             if stdin_command["cmd"] == RECORDER_STDIN_CANCEL:
                 print("\nCancelling recording...", file=sys.stderr)
@@ -9,12 +9,24 @@ Outputs JSON to stdout with permission status.
 
 import json
 import sys
+import time
 import platform
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
+IS_MACOS = sys.platform == 'darwin'
+
+# Upper bound on waiting for ScreenCaptureKit's shareable-content callback.
+SCREEN_RECORDING_CHECK_TIMEOUT_S = 2.0
+# Run-loop slice between callback checks while waiting.
+SCREEN_RECORDING_RUN_LOOP_SLICE_S = 0.01
+
+
+@functools.lru_cache(maxsize=1)
 def get_macos_version() -> tuple:
     """
-    Get macOS version as tuple (major, minor).
+    Get macOS version as tuple (major, minor). Cached: the OS can't change under us.
 
     Returns:
         Tuple of (major, minor) version numbers, e.g., (14, 0) for Sonoma
@@ -191,7 +203,7 @@ def check_screen_recording_permission() -> tuple[bool, str]:
 
     try:
         from ScreenCaptureKit import SCShareableContent
-        from Foundation import NSRunLoop, NSDate
+        from CoreFoundation import CFRunLoopRunInMode, kCFRunLoopDefaultMode
 
         # Track permission status
         permission_granted = [None]  # Use list for callback modification
@@ -208,9 +220,11 @@ def check_screen_recording_permission() -> tuple[bool, str]:
         # Request shareable content (triggers permission prompt if needed)
         SCShareableContent.getShareableContentWithCompletionHandler_(completion_handler)
 
-        # Run the event loop for up to 2 seconds to wait for callback
-        timeout = NSDate.dateWithTimeIntervalSinceNow_(2.0)
-        NSRunLoop.currentRunLoop().runUntilDate_(timeout)
+        # Spin the run loop in short slices and stop as soon as the callback has
+        # reported, instead of always blocking for the whole timeout.
+        deadline = time.monotonic() + SCREEN_RECORDING_CHECK_TIMEOUT_S
+        while permission_granted[0] is None and time.monotonic() < deadline:
+            CFRunLoopRunInMode(kCFRunLoopDefaultMode, SCREEN_RECORDING_RUN_LOOP_SLICE_S, True)
 
         # Check result
         if permission_granted[0] is None:
@@ -244,7 +258,7 @@ def main():
     )
     args = parser.parse_args()
 
-    if platform.system() != 'Darwin':
+    if not IS_MACOS:
         print(json.dumps({
             "platform": platform.system(),
             "microphone": {"granted": True},
@@ -259,35 +273,40 @@ def main():
     # Check macOS version compatibility first
     version_compatible, version_str, version_warning = check_macos_version_compatibility()
 
-    # Check microphone permission
-    mic_granted, mic_error = check_microphone_permission(args.mic_device_id)
+    # Check microphone permission on a worker: PortAudio enumeration/open is
+    # independent of the desktop and Screen Recording checks below, which stay
+    # on this thread because the PyObjC fallback spins its run loop.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mic-permission") as mic_pool:
+        mic_future = mic_pool.submit(check_microphone_permission, args.mic_device_id)
 
-    # Check whether the selected macOS runtime can capture desktop audio at all.
-    if version_compatible:
-        desktop_available, desktop_backend, desktop_error = check_desktop_audio_capture_availability()
-    else:
-        desktop_available = False
-        desktop_backend = None
-        desktop_error = version_warning
-
-    # Screen Recording: only probe when explicitly requested. Preflight always skips
-    # because the preferred tap path needs System Audio Recording, not Screen Recording.
-    screen_skipped = False
-    if not version_compatible:
-        screen_granted = False
-        screen_error = version_warning
-    elif args.skip_screen_recording_check:
-        screen_granted = None
-        screen_error = ""
-        screen_skipped = True
-    elif desktop_available:
-        screen_granted, screen_error = check_screen_recording_permission()
-    else:
-        # No capture backend means Screen Recording cannot be meaningfully tested.
-        # Report the backend problem separately so the UI does not send users to
-        # privacy settings for a packaging/runtime failure.
-        screen_granted = True
-        screen_error = ""
+        # Check whether the selected macOS runtime can capture desktop audio at all.
+        if version_compatible:
+            desktop_available, desktop_backend, desktop_error = check_desktop_audio_capture_availability()
+        else:
+            desktop_available = False
+            desktop_backend = None
+            desktop_error = version_warning
+
+        # Screen Recording: only probe when explicitly requested. Preflight always skips
+        # because the preferred tap path needs System Audio Recording, not Screen Recording.
+        screen_skipped = False
+        if not version_compatible:
+            screen_granted = False
+            screen_error = version_warning
+        elif args.skip_screen_recording_check:
+            screen_granted = None
+            screen_error = ""
+            screen_skipped = True
+        elif desktop_available:
+            screen_granted, screen_error = check_screen_recording_permission()
+        else:
+            # No capture backend means Screen Recording cannot be meaningfully tested.
+            # Report the backend problem separately so the UI does not send users to
+            # privacy settings for a packaging/runtime failure.
+            screen_granted = True
+            screen_error = ""
+
+        mic_granted, mic_error = mic_future.result()
 
     # System Audio Recording is not probed proactively (no stable public API);
     # the helper requests it when starting the CoreAudio tap on macOS 14.2+.
@@ -361,8 +380,8 @@ def main():
             "audiocapture-helper is present and signed."
         )
 
-    # Output JSON
-    print(json.dumps(result, indent=2), file=sys.stdout)
+    # Output JSON on one line; Electron JSON.parse()s the whole of stdout.
+    print(json.dumps(result), file=sys.stdout)
 
     # Exit with error code if any required permission or capture backend is missing
     if not result["all_granted"]:
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, MutableMapping
+import re
+from typing import Any, Dict, Iterable, List, MutableMapping, Tuple
 
 WINDOWS_BLOCKED_DEVICE_NAME_FRAGMENTS = (
     "Microsoft Sound Mapper",
     "Primary Sound Capture Driver",
     "Primary Sound Driver",
 )
+# One C-level scan per name instead of a Python-level loop over fragments.
+_WINDOWS_BLOCKED_DEVICE_NAME_RE = re.compile(
+    "|".join(re.escape(fragment) for fragment in WINDOWS_BLOCKED_DEVICE_NAME_FRAGMENTS)
+)
+
+# Same-named Windows endpoints show up once per host API; prefer the one with
+# the lowest-latency, highest-fidelity path before comparing sample rates.
+# WDM-KS ranks last: its kernel-streaming endpoints often refuse to open or
+# take the device exclusively, so it should never displace an MME entry.
+WINDOWS_HOST_API_RANK = {
+    "Windows WASAPI": 2,
+    "Windows DirectSound": 1,
+    "MME": 0,
+    "Windows WDM-KS": -1,
+}
 
 MACOS_SCREENCAPTURE_LOOPBACK_DEVICE = {
     "id": -1,
@@ -20,7 +36,7 @@ MACOS_SCREENCAPTURE_LOOPBACK_DEVICE = {
 
 
 def is_blocked_windows_device_name(name: str) -> bool:
-    return any(blocked in str(name or "") for blocked in WINDOWS_BLOCKED_DEVICE_NAME_FRAGMENTS)
+    return _WINDOWS_BLOCKED_DEVICE_NAME_RE.search(str(name or "")) is not None
 
 
 def build_device_record(
@@ -40,16 +56,22 @@ def build_device_record(
     }
 
 
+def device_quality_score(device: Dict[str, Any]) -> Tuple[int, int]:
+    """Rank duplicates by host API first, then by sample rate."""
+    return (
+        WINDOWS_HOST_API_RANK.get(str(device.get("host_api") or ""), 0),
+        int(device.get("sample_rate") or 0),
+    )
+
+
 def dedupe_device_by_name(
     seen: MutableMapping[str, Dict[str, Any]],
     candidate: Dict[str, Any],
 ) -> None:
-    """Keep unique device names, preferring the higher sample rate on collision."""
+    """Keep unique device names, preferring the better ``device_quality_score`` on collision."""
     name = str(candidate.get("name") or "")
-    if name not in seen:
-        seen[name] = candidate
-        return
-    if int(candidate.get("sample_rate") or 0) > int(seen[name].get("sample_rate") or 0):
+    current = seen.get(name)
+    if current is None or device_quality_score(candidate) > device_quality_score(current):
         seen[name] = candidate
 
 
@@ -8,7 +8,6 @@ Platform-specific implementations:
 
 import json
 import sys
-import platform
 from typing import Dict, List, Any, Optional
 
 from device_helpers import (
@@ -20,8 +19,8 @@ from device_helpers import (
 )
 
 # Platform detection
-IS_WINDOWS = platform.system() == 'Windows'
-IS_MACOS = platform.system() == 'Darwin'
+IS_WINDOWS = sys.platform == 'win32'
+IS_MACOS = sys.platform == 'darwin'
 
 pyaudio: Optional[object] = None
 sd: Optional[object] = None
@@ -56,27 +55,81 @@ def load_audio_backend():
                 ) from exc
         return sd
 
-    raise DeviceManagerEnvironmentError(f"Unsupported platform: {platform.system()}")
+    raise DeviceManagerEnvironmentError(f"Unsupported platform: {sys.platform}")
+
+
+def _as_device_index(value: Any) -> int:
+    """Normalize a sounddevice default slot (index, -1 or None) to an index or -1."""
+    if value is None or isinstance(value, bool):
+        return -1
+    try:
+        index = int(value)
+    except (TypeError, ValueError):
+        return -1
+    return index if index >= 0 else -1
 
 
 class DeviceManager:
     """Manages audio device enumeration and information retrieval."""
 
     def __init__(self):
-        if IS_WINDOWS:
-            backend = load_audio_backend()
-            self.audio_backend = backend
-            self.pa = backend.PyAudio()
-        elif IS_MACOS:
+        if IS_WINDOWS or IS_MACOS:
+            # Import now so a missing backend surfaces as an environment error.
             self.audio_backend = load_audio_backend()
-            self.pa = None  # sounddevice doesn't need initialization
         else:
-            raise DeviceManagerEnvironmentError(f"Unsupported platform: {platform.system()}")
+            raise DeviceManagerEnvironmentError(f"Unsupported platform: {sys.platform}")
+        # PyAudio (Windows only) is opened on first use; sounddevice needs no handle.
+        self._pa = None
+        # Raw device infos from the last enumeration; see _device_infos().
+        self._device_snapshot: Optional[List[Any]] = None
+
+    @property
+    def pa(self):
+        """PyAudio handle, initialized (PortAudio load + device scan) on first access."""
+        if self._pa is None and IS_WINDOWS:
+            self._pa = self.audio_backend.PyAudio()
+        return self._pa
+
+    @pa.setter
+    def pa(self, value) -> None:
+        self._pa = value
+
+    def close(self) -> None:
+        """Terminate the PyAudio instance, if one was opened. Safe to call twice."""
+        self._device_snapshot = None
+        pa, self._pa = self._pa, None
+        if pa is not None:
+            pa.terminate()
+
+    def __enter__(self) -> "DeviceManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _device_infos(self) -> List[Any]:
+        """
+        Raw device infos, enumerated once per manager until ``close()``.
 
-    def __del__(self):
-        """Clean up PyAudio instance."""
-        if IS_WINDOWS and hasattr(self, 'pa') and self.pa:
-            self.pa.terminate()
+        Windows entries are ``(index, info)`` pairs for every readable device;
+        macOS entries are sounddevice's device dicts in index order. Failed
+        enumerations raise and are not cached.
+        """
+        if self._device_snapshot is None:
+            if IS_WINDOWS:
+                self._device_snapshot = self._query_device_infos_windows()
+            else:
+                self._device_snapshot = list(sd.query_devices())
+        return self._device_snapshot
+
+    def _query_device_infos_windows(self) -> List[Any]:
+        infos = []
+        for i in range(self.pa.get_device_count()):
+            try:
+                infos.append((i, self.pa.get_device_info_by_index(i)))
+            except Exception as e:
+                print(f"Warning: Could not read device {i}: {e}", file=sys.stderr)
+        return infos
 
     def list_all_devices(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -91,19 +144,17 @@ class DeviceManager:
         elif IS_MACOS:
             return self._list_devices_macos()
 
-        raise DeviceManagerEnvironmentError(f"Unsupported platform: {platform.system()}")
+        raise DeviceManagerEnvironmentError(f"Unsupported platform: {sys.platform}")
 
     def _list_devices_windows(self) -> Dict[str, List[Dict[str, Any]]]:
         """Windows-specific device enumeration using pyaudiowpatch."""
-        seen_inputs = {}
-        seen_outputs = {}
-        seen_loopbacks = {}
-
-        device_count = self.pa.get_device_count()
+        # One best-device-per-name table per category, filled in a single pass.
+        seen = {"input_devices": {}, "output_devices": {}, "loopback_devices": {}}
+        # A handful of host APIs serve every device: name them once, not per device.
+        host_api_names = self._host_api_names_windows()
 
-        for i in range(device_count):
+        for i, device_info in self._device_infos():
             try:
-                device_info = self.pa.get_device_info_by_index(i)
                 name = device_info.get("name", "Unknown")
 
                 if is_blocked_windows_device_name(name):
@@ -114,30 +165,37 @@ class DeviceManager:
                     name=name,
                     channels=device_info.get("maxInputChannels", 0),
                     sample_rate=int(device_info.get("defaultSampleRate", 44100)),
-                    host_api=self.pa.get_host_api_info_by_index(
-                        device_info.get("hostApi", 0)
-                    ).get("name", "Unknown"),
+                    host_api=host_api_names.get(device_info.get("hostApi", 0), "Unknown"),
                 )
 
-                is_loopback = device_info.get("isLoopbackDevice", False)
-
-                if is_loopback:
-                    dedupe_device_by_name(seen_loopbacks, device_data)
+                if device_info.get("isLoopbackDevice", False):
+                    category = "loopback_devices"
                 elif device_info.get("maxInputChannels", 0) > 0:
-                    dedupe_device_by_name(seen_inputs, device_data)
+                    category = "input_devices"
                 elif device_info.get("maxOutputChannels", 0) > 0:
-                    dedupe_device_by_name(seen_outputs, device_data)
+                    category = "output_devices"
+                else:
+                    continue
+                dedupe_device_by_name(seen[category], device_data)
 
             except Exception as e:
                 print(f"Warning: Could not read device {i}: {e}", file=sys.stderr)
                 continue
 
         return {
-            "input_devices": sort_devices_by_name(seen_inputs.values()),
-            "output_devices": sort_devices_by_name(seen_outputs.values()),
-            "loopback_devices": sort_devices_by_name(seen_loopbacks.values()),
+            category: sort_devices_by_name(devices.values())
+            for category, devices in seen.items()
         }
 
+    def _host_api_names_windows(self) -> Dict[int, str]:
+        names = {}
+        for index in range(self.pa.get_host_api_count()):
+            try:
+                names[index] = self.pa.get_host_api_info_by_index(index).get("name", "Unknown")
+            except Exception as e:
+                print(f"Warning: Could not read host API {index}: {e}", file=sys.stderr)
+        return names
+
     def _list_devices_macos(self) -> Dict[str, List[Dict[str, Any]]]:
         """macOS-specific device enumeration using sounddevice."""
         input_devices = []
@@ -145,7 +203,7 @@ class DeviceManager:
         loopback_devices = macos_virtual_loopback_devices()
 
         try:
-            devices = sd.query_devices()
+            devices = self._device_infos()
         except Exception as e:
             print(f"ERROR: Could not enumerate audio devices: {e}", file=sys.stderr)
             print(f"Microphone permission may not be granted.", file=sys.stderr)
@@ -157,25 +215,26 @@ class DeviceManager:
                 "loopback_devices": loopback_devices
             }
 
+        host_apis = sd.query_hostapis()
+
         for i, device in enumerate(devices):
             if device['max_input_channels'] == 0 and device['max_output_channels'] == 0:
                 continue
 
-            device_data = build_device_record(
-                device_id=i,
-                name=device['name'],
-                channels=device['max_input_channels'],
-                sample_rate=int(device['default_samplerate']),
-                host_api=sd.query_hostapis(device['hostapi'])['name'],
-            )
+            # Dual-role devices get one record per role, built directly with the
+            # role's channel count rather than copied and patched.
+            common = {
+                "device_id": i,
+                "name": device['name'],
+                "sample_rate": int(device['default_samplerate']),
+                "host_api": host_apis[device['hostapi']]['name'],
+            }
 
             if device['max_input_channels'] > 0:
-                input_devices.append(device_data)
+                input_devices.append(build_device_record(channels=device['max_input_channels'], **common))
 
             if device['max_output_channels'] > 0:
-                output_device = device_data.copy()
-                output_device['channels'] = device['max_output_channels']
-                output_devices.append(output_device)
+                output_devices.append(build_device_record(channels=device['max_output_channels'], **common))
 
         return {
             "input_devices": sort_devices_by_name(input_devices),
@@ -195,7 +254,8 @@ class DeviceManager:
             return
 
         if IS_MACOS:
-            devices = sd.query_devices()
+            # Same snapshot the listing used: one PortAudio enumeration per manager.
+            devices = self._device_infos()
             if device_id < 0 or device_id >= len(devices):
                 raise ValueError(f"{label} device ID {device_id} is out of range (0-{len(devices) - 1})")
             if devices[device_id]["max_input_channels"] <= 0:
@@ -219,7 +279,7 @@ class DeviceManager:
         elif IS_MACOS:
             return self._get_device_info_macos(device_id)
 
-        return {"error": f"Unsupported platform: {platform.system()}"}
+        return {"error": f"Unsupported platform: {sys.platform}"}
 
     def _get_device_info_windows(self, device_id: int) -> Dict[str, Any]:
         """Windows-specific device info retrieval."""
@@ -286,23 +346,14 @@ class DeviceManager:
     def _get_default_devices_macos(self) -> Dict[str, int]:
         """macOS-specific default device retrieval."""
         try:
-            default_input = sd.query_devices(kind='input')
-            default_output = sd.query_devices(kind='output')
-
-            # sounddevice returns device info directly, need to find the index
-            input_idx = -1
-            output_idx = -1
-
-            devices = sd.query_devices()
-            for i, device in enumerate(devices):
-                if device['name'] == default_input['name']:
-                    input_idx = i
-                if device['name'] == default_output['name']:
-                    output_idx = i
+            # sd.default.device already holds PortAudio's default indices (-1
+            # when there is none), so no enumeration or name matching is needed.
+            default_pair = sd.default.device
+            default_input, default_output = default_pair[0], default_pair[1]
 
             return {
-                "default_input": input_idx,
-                "default_output": output_idx
+                "default_input": _as_device_index(default_input),
+                "default_output": _as_device_index(default_output)
             }
         except Exception as e:
             print(f"Warning: Could not get default devices: {e}", file=sys.stderr)
@@ -320,20 +371,22 @@ def main():
         print(f"ERROR: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    # Get all devices
-    devices = manager.list_all_devices()
+    # Tear PortAudio down deterministically rather than at interpreter exit.
+    with manager:
+        # Get all devices
+        devices = manager.list_all_devices()
 
-    # Get default devices
-    defaults = manager.get_default_devices()
+        # Get default devices
+        defaults = manager.get_default_devices()
 
-    # Combine into single output
-    output = {
-        **devices,
-        "defaults": defaults
-    }
+    # Combine into single output (list_all_devices returns a fresh dict).
+    output = devices
+    output["defaults"] = defaults
 
-    # Output as JSON
-    print(json.dumps(output, indent=2))
+    # Single-line JSON: Electron JSON.parse()s the whole of stdout, so
+    # indentation would only inflate the payload. json.dumps (not json.dump)
+    # so the one-shot C encoder is used.
+    print(json.dumps(output))
 
 
 if __name__ == "__main__":
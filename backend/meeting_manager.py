@@ -302,7 +302,7 @@ class MeetingManager:
         print(f"Meeting saved: {meeting_id}", file=sys.stderr)
         return meeting
 
-    def _add_meeting_direct(
+    def _build_scanned_meeting(
         self,
         meeting_id: str,
         audio_path: str,
@@ -313,60 +313,70 @@ class MeetingManager:
         title: str,
         transcription_status: str = "completed",
         transcription_error: Optional[str] = None,
-    ) -> Optional[Dict]:
+    ) -> Dict:
         """
-        Add a meeting directly without copying files (used by scan).
+        Build the metadata record for a recording found on disk (used by scan).
         Files are assumed to already be in the correct location.
+        """
+        # Format duration
+        minutes = int(duration // 60)
+        seconds = int(duration % 60)
+        duration_str = f"{minutes}:{seconds:02d}"
+
+        # Parse meeting_id to get date
+        # Handle suffixed IDs like "20260107_104555_1" by extracting base ID
+        try:
+            parts = meeting_id.split('_')
+            if len(parts) >= 2:
+                base_id = f"{parts[0]}_{parts[1]}"
+                dt = datetime.strptime(base_id, "%Y%m%d_%H%M%S")
+            else:
+                dt = datetime.strptime(meeting_id, "%Y%m%d_%H%M%S")
+            date_iso = dt.isoformat()
+        except (ValueError, IndexError):
+            date_iso = datetime.now().isoformat()
+
+        return {
+            'id': meeting_id,
+            'title': title,
+            'date': date_iso,
+            'duration': duration_str,
+            'durationSeconds': duration,
+            'audioPath': audio_path,
+            'transcriptPath': transcript_path,
+            'language': language,
+            'model': model,
+            'transcriptionStatus': self._normalize_transcription_status(transcription_status),
+            'transcriptionError': self._normalize_transcription_error(transcription_error),
+        }
+
+    def _insert_scanned_meetings(self, candidates: List[Dict]) -> List[Dict]:
+        """
+        Add scanned meetings with a single metadata save.
+
+        Candidates whose ID is already stored are skipped (defense-in-depth
+        against concurrent writers since the scan took its snapshot).
 
         Returns:
-            Meeting object if added, None if ID already exists (duplicate prevention)
+            The meetings that were actually added
         """
         with self._metadata_guard():
             meetings = self._list_meetings_locked()
-
-            # Check for duplicate ID (defense-in-depth)
             existing_ids = {m['id'] for m in meetings}
-            if meeting_id in existing_ids:
-                print(f"Warning: Skipping duplicate meeting ID: {meeting_id}", file=sys.stderr)
-                return None
 
-            # Format duration
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
-            duration_str = f"{minutes}:{seconds:02d}"
+            added = []
+            for meeting in candidates:
+                if meeting['id'] in existing_ids:
+                    print(f"Warning: Skipping duplicate meeting ID: {meeting['id']}", file=sys.stderr)
+                    continue
+                existing_ids.add(meeting['id'])
+                added.append(meeting)
 
-            # Parse meeting_id to get date
-            # Handle suffixed IDs like "20260107_104555_1" by extracting base ID
-            try:
-                parts = meeting_id.split('_')
-                if len(parts) >= 2:
-                    base_id = f"{parts[0]}_{parts[1]}"
-                    dt = datetime.strptime(base_id, "%Y%m%d_%H%M%S")
-                else:
-                    dt = datetime.strptime(meeting_id, "%Y%m%d_%H%M%S")
-                date_iso = dt.isoformat()
-            except (ValueError, IndexError):
-                date_iso = datetime.now().isoformat()
-
-            meeting = {
-                'id': meeting_id,
-                'title': title,
-                'date': date_iso,
-                'duration': duration_str,
-                'durationSeconds': duration,
-                'audioPath': audio_path,
-                'transcriptPath': transcript_path,
-                'language': language,
-                'model': model,
-                'transcriptionStatus': self._normalize_transcription_status(transcription_status),
-                'transcriptionError': self._normalize_transcription_error(transcription_error),
-            }
-
-            # Add to beginning of existing meetings (most recent first)
-            meetings.insert(0, meeting)
-
-            self._save_meetings_unlocked(meetings)
-            return meeting
+            if added:
+                # Add to beginning of existing meetings (most recent first)
+                meetings[:0] = added
+                self._save_meetings_unlocked(meetings)
+            return added
 
     def list_meetings(self) -> List[Dict]:
         """
@@ -395,10 +405,12 @@ class MeetingManager:
         """
         existing_meetings = self.list_meetings()
         existing_audio_paths = {Path(m['audioPath']).name for m in existing_meetings}
+        existing_ids = {m['id'] for m in existing_meetings}
 
         scanned = 0
         added = 0
         skipped = 0
+        candidates: List[Dict] = []
 
         # Promote orphaned recorder temps (.pcm.tmp / legacy *.temp.wav) to
         # scannable WAVs, or delete temps when a final Opus/WAV already exists.
@@ -456,7 +468,6 @@ class MeetingManager:
             meeting_id, title = meeting_scan.parse_scan_meeting_id_and_title(audio_file.stem)
 
             # Check if this ID already exists in database
-            existing_ids = {m['id'] for m in existing_meetings}
             if meeting_id in existing_ids:
                 print(f"Skipping {audio_file.name}: ID {meeting_id} already exists", file=sys.stderr)
                 skipped += 1
@@ -474,7 +485,7 @@ class MeetingManager:
                     skipped += 1
                     continue
 
-                meeting = self._add_meeting_direct(
+                meeting = self._build_scanned_meeting(
                     meeting_id=meeting_id,
                     audio_path=str(resolved_audio),
                     transcript_path=str(resolved_transcript),
@@ -484,18 +495,28 @@ class MeetingManager:
                     title=title,
                     transcription_status="pending" if placeholder_created else "completed",
                 )
-                if meeting is not None:
-                    existing_meetings.append(meeting)
-                    existing_audio_paths.add(Path(meeting['audioPath']).name)
-                    added += 1
-                    print(f"Added meeting from filesystem: {audio_file.name} (ID: {meeting_id})", file=sys.stderr)
-                else:
-                    # Duplicate detected by _add_meeting_direct
-                    skipped += 1
+                candidates.append(meeting)
+                existing_ids.add(meeting_id)
+                existing_audio_paths.add(Path(meeting['audioPath']).name)
             except Exception as e:
                 print(f"Error adding meeting {audio_file.name}: {e}", file=sys.stderr)
                 skipped += 1
 
+        # One metadata rewrite for the whole scan instead of one per recording.
+        if candidates:
+            try:
+                inserted = self._insert_scanned_meetings(candidates)
+            except Exception as e:
+                print(f"Error adding scanned meetings: {e}", file=sys.stderr)
+                inserted = []
+            for meeting in inserted:
+                print(
+                    f"Added meeting from filesystem: {Path(meeting['audioPath']).name} (ID: {meeting['id']})",
+                    file=sys.stderr,
+                )
+            added += len(inserted)
+            skipped += len(candidates) - len(inserted)
+
         return {
             'scanned': scanned,
             'added': added,
@@ -513,38 +534,38 @@ class MeetingManager:
             Meeting object or None if not found
         """
         with self._metadata_guard():
-            meetings = self._list_meetings_locked()
-            for meeting in meetings:
-                if meeting['id'] == meeting_id:
-                    hydrated = dict(meeting)
-                    safe_transcript_path = self._resolve_accessible_recordings_file(
-                        Path(meeting['transcriptPath']),
-                        allowed_suffixes=('.md',),
-                        must_exist=True,
-                        label='transcript',
-                    )
-                    transcript_text = self._read_transcript_text(safe_transcript_path) if safe_transcript_path else ""
-                    if transcript_text:
-                        hydrated['transcript'] = transcript_text
-                    elif meeting.get('transcript'):
-                        hydrated['transcript'] = meeting['transcript']
-                    else:
-                        hydrated['transcript'] = ""
-                    summary = (meeting.get('ai') or {}).get('summary')
-                    summary_path = summary.get('markdownPath') if isinstance(summary, dict) else None
-                    safe_summary_path = self._resolve_accessible_recordings_file(
-                        Path(summary_path),
-                        allowed_suffixes=('.md',),
-                        must_exist=True,
-                        label='summary',
-                    ) if summary_path else None
-                    hydrated['summary'] = self._read_text_file(safe_summary_path, 'summary') if safe_summary_path else ""
-                    if isinstance(summary, dict) and summary.get('sourceTranscriptHash'):
-                        hydrated['summaryStale'] = summary.get('sourceTranscriptHash') != self._hash_text(hydrated.get('transcript', ''))
-                    else:
-                        hydrated['summaryStale'] = False
-                    return hydrated
-            return None
+            meeting = next((m for m in self._list_meetings_locked() if m['id'] == meeting_id), None)
+            if meeting is None:
+                return None
+
+            hydrated = dict(meeting)
+            safe_transcript_path = self._resolve_accessible_recordings_file(
+                Path(meeting['transcriptPath']),
+                allowed_suffixes=('.md',),
+                must_exist=True,
+                label='transcript',
+            )
+            transcript_text = self._read_transcript_text(safe_transcript_path) if safe_transcript_path else ""
+            if transcript_text:
+                hydrated['transcript'] = transcript_text
+            elif meeting.get('transcript'):
+                hydrated['transcript'] = meeting['transcript']
+            else:
+                hydrated['transcript'] = ""
+            summary = (meeting.get('ai') or {}).get('summary')
+            summary_path = summary.get('markdownPath') if isinstance(summary, dict) else None
+            safe_summary_path = self._resolve_accessible_recordings_file(
+                Path(summary_path),
+                allowed_suffixes=('.md',),
+                must_exist=True,
+                label='summary',
+            ) if summary_path else None
+            hydrated['summary'] = self._read_text_file(safe_summary_path, 'summary') if safe_summary_path else ""
+            if isinstance(summary, dict) and summary.get('sourceTranscriptHash'):
+                hydrated['summaryStale'] = summary.get('sourceTranscriptHash') != self._hash_text(hydrated.get('transcript', ''))
+            else:
+                hydrated['summaryStale'] = False
+            return hydrated
 
     def update_meeting(self, meeting_id: str, *, title: Optional[str] = None) -> Optional[Dict]:
         """
@@ -777,6 +798,11 @@ class MeetingManager:
         meeting_store.save_meetings(self, meetings)
 
 
+def _print_json(value, pretty: bool = False) -> None:
+    """Print CLI output; compact by default since Electron JSON.parse()s stdout."""
+    print(json.dumps(value, indent=2 if pretty else None))
+
+
 # CLI interface for testing
 def main():
     """CLI for testing meeting manager."""
@@ -784,6 +810,7 @@ def main():
 
     parser = argparse.ArgumentParser(description="Meeting Manager CLI")
     parser.add_argument('--recordings-dir', default='recordings', help='Recordings directory path')
+    parser.add_argument('--pretty', action='store_true', help='Indent JSON output for reading')
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
     # List meetings
@@ -850,16 +877,16 @@ def main():
 
     if args.command == 'list':
         meetings = manager.list_meetings()
-        print(json.dumps(meetings, indent=2))
+        _print_json(meetings, args.pretty)
 
     elif args.command == 'scan':
         result = manager.scan_and_sync_recordings()
-        print(json.dumps(result, indent=2))
+        _print_json(result, args.pretty)
 
     elif args.command == 'get':
         meeting = manager.get_meeting(args.id)
         if meeting:
-            print(json.dumps(meeting, indent=2))
+            _print_json(meeting, args.pretty)
         else:
             print(f"Meeting not found: {args.id}", file=sys.stderr)
             sys.exit(1)
@@ -874,7 +901,7 @@ def main():
     elif args.command == 'update':
         meeting = manager.update_meeting(args.id, title=args.title)
         if meeting:
-            print(json.dumps(meeting, indent=2))
+            _print_json(meeting, args.pretty)
         else:
             print(f"Meeting not found: {args.id}", file=sys.stderr)
             sys.exit(1)
@@ -892,7 +919,7 @@ def main():
             compute_type=args.compute_type,
         )
         if meeting:
-            print(json.dumps(meeting, indent=2))
+            _print_json(meeting, args.pretty)
         else:
             print(f"Meeting not found: {args.id}", file=sys.stderr)
             sys.exit(1)
@@ -914,7 +941,7 @@ def main():
             summary=summary_metadata,
         )
         if meeting:
-            print(json.dumps(meeting, indent=2))
+            _print_json(meeting, args.pretty)
         else:
             print(f"Meeting not found: {args.id}", file=sys.stderr)
             sys.exit(1)
@@ -932,7 +959,7 @@ def main():
             transcription_device=args.transcription_device,
             transcription_compute_type=args.transcription_compute_type,
         )
-        print(json.dumps(meeting, indent=2))
+        _print_json(meeting, args.pretty)
 
     else:
         parser.print_help()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
 import sys
@@ -23,6 +24,17 @@ _RECOVERY_STAGING_SUFFIXES = (".recovering.opus", ".recovering.wav")
 # RIFF/WAVE header is 44 bytes. Keep aligned with audio.recorder_temp_paths.
 _MIN_RECOVERABLE_PCM_BYTES = 44
 
+_SCANNABLE_AUDIO_SUFFIXES = (".opus", ".wav")
+
+# Compiled once: the scan runs these for every recording on disk.
+_DURATION_HMS_RE = re.compile(r"\*\*Duration:\*\*\s*(\d+):(\d+):(\d+)")
+_DURATION_MS_RE = re.compile(r"\*\*Duration:\*\*\s*(\d+):(\d+)")
+_MEETING_STEM_RE = re.compile(r"meeting_(\d{8}_\d{6}(?:_\d+)?)$")
+_RECORDING_TIMESTAMP_RE = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2}-\d{2}-\d{2})")
+
+# build_transcript_markdown writes **Duration:** in the first few header lines.
+_TRANSCRIPT_HEADER_BYTES = 4096
+
 
 def recording_stem_from_audio_path(path: Path) -> str:
     """Return the meeting/recording stem, stripping recorder temp suffixes."""
@@ -281,8 +293,19 @@ def recover_or_cleanup_recorder_temps(recordings_dir: Path) -> Dict[str, int]:
 
 def select_scannable_audio_files(recordings_dir: Path) -> List[Path]:
     preferred_files = {}
-
-    for audio_file in list(recordings_dir.glob("*.opus")) + list(recordings_dir.glob("*.wav")):
+    if not recordings_dir.is_dir():
+        return []
+
+    # One scandir pass instead of a glob per extension; normcase keeps
+    # glob's case-insensitive matching on Windows.
+    with os.scandir(recordings_dir) as entries:
+        candidates = [
+            Path(entry.path)
+            for entry in entries
+            if os.path.normcase(entry.name).endswith(_SCANNABLE_AUDIO_SUFFIXES) and entry.is_file()
+        ]
+
+    for audio_file in candidates:
         if is_recorder_temp_audio_file(audio_file):
             # Defense in depth for any legacy *.temp.wav that still matches *.wav.
             continue
@@ -308,12 +331,12 @@ def select_scannable_audio_files(recordings_dir: Path) -> List[Path]:
 
 def extract_duration_seconds_from_transcript(content: str) -> float:
     """Parse Duration lines from AvaNevis transcript Markdown."""
-    duration_match = re.search(r"\*\*Duration:\*\*\s*(\d+):(\d+):(\d+)", content)
+    duration_match = _DURATION_HMS_RE.search(content)
     if duration_match:
         hours, mins, secs = map(int, duration_match.groups())
         return float(hours * 3600 + mins * 60 + secs)
 
-    duration_match = re.search(r"\*\*Duration:\*\*\s*(\d+):(\d+)", content)
+    duration_match = _DURATION_MS_RE.search(content)
     if duration_match:
         mins, secs = map(int, duration_match.groups())
         return float(mins * 60 + secs)
@@ -323,8 +346,17 @@ def extract_duration_seconds_from_transcript(content: str) -> float:
 
 def extract_duration_from_transcript_file(transcript_file: Path) -> float:
     try:
-        content = transcript_file.read_text(encoding="utf-8", errors="replace")
-        return extract_duration_seconds_from_transcript(content)
+        with transcript_file.open("rb") as handle:
+            head = handle.read(_TRANSCRIPT_HEADER_BYTES)
+            if len(head) == _TRANSCRIPT_HEADER_BYTES:
+                # Finish the line the window cut so "12:34" is never parsed as "12:3".
+                head += handle.readline()
+            duration = extract_duration_seconds_from_transcript(head.decode("utf-8", errors="replace"))
+            if duration or len(head) <= _TRANSCRIPT_HEADER_BYTES:
+                return duration
+            # Hand-edited transcripts may move the header; keep the old full-text search.
+            content = head + handle.read()
+        return extract_duration_seconds_from_transcript(content.decode("utf-8", errors="replace"))
     except Exception as exc:
         print(f"Warning: Could not extract duration from {transcript_file.name}: {exc}", file=sys.stderr)
         return 0.0
@@ -343,7 +375,7 @@ def parse_scan_meeting_id_and_title(
     - recording_* with ISO-like timestamp
     - fallback to current timestamp
     """
-    meeting_match = re.match(r"meeting_(\d{8}_\d{6}(?:_\d+)?)$", filename_stem)
+    meeting_match = _MEETING_STEM_RE.match(filename_stem)
     if meeting_match:
         meeting_id = meeting_match.group(1)
         try:
@@ -355,7 +387,7 @@ def parse_scan_meeting_id_and_title(
             title = f"Meeting {meeting_id}"
         return meeting_id, title
 
-    recording_match = re.search(r"(\d{4}-\d{2}-\d{2})T(\d{2}-\d{2}-\d{2})", filename_stem)
+    recording_match = _RECORDING_TIMESTAMP_RE.search(filename_stem)
     if recording_match:
         date_str, time_str = recording_match.groups()
         meeting_id = date_str.replace("-", "") + "_" + time_str.replace("-", "")
@@ -73,6 +73,17 @@ def backup_corrupt_metadata(manager, error: json.JSONDecodeError) -> Optional[Pa
     return backup_path
 
 
+def _encode_meetings(meetings: List[Dict]) -> str:
+    """One compact meeting per line.
+
+    ``indent=2`` forces json's pure-Python encoder; encoding each meeting
+    compactly keeps the C encoder while the file stays line-per-meeting.
+    """
+    if not meetings:
+        return "[]\n"
+    return "[\n" + ",\n".join(json.dumps(meeting, ensure_ascii=False) for meeting in meetings) + "\n]\n"
+
+
 def save_meetings_unlocked(manager, meetings: List[Dict]):
     """Atomically save meetings without acquiring the metadata guard.
 
@@ -91,9 +102,12 @@ def save_meetings_unlocked(manager, meetings: List[Dict]):
 
     try:
         with os_mod.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-            json.dump(meetings, f, indent=2, ensure_ascii=False)
+            f.write(_encode_meetings(meetings))
             f.flush()
-            os_mod.fsync(f.fileno())
+            # Only the contents (and size) of the temp file must be durable
+            # before the rename; fdatasync skips the extra inode metadata
+            # flush where the platform offers it (not on macOS/Windows).
+            getattr(os_mod, 'fdatasync', os_mod.fsync)(f.fileno())
 
         os_mod.replace(temp_path, manager.metadata_file)
         manager._corrupt_metadata_backup_path = None
@@ -116,17 +130,11 @@ def list_meetings_locked(manager) -> List[Dict]:
     """Load and deduplicate meetings while already holding the metadata guard."""
     meetings = manager._load_meetings_unlocked()
 
-    seen_ids = set()
-    unique_meetings = []
-    duplicates_found = 0
-
+    first_by_id: Dict = {}
     for meeting in meetings:
-        meeting_id = meeting.get('id')
-        if meeting_id not in seen_ids:
-            seen_ids.add(meeting_id)
-            unique_meetings.append(meeting)
-        else:
-            duplicates_found += 1
+        first_by_id.setdefault(meeting.get('id'), meeting)
+    unique_meetings = list(first_by_id.values())
+    duplicates_found = len(meetings) - len(unique_meetings)
 
     if duplicates_found > 0:
         print(f"Warning: Found and removed {duplicates_found} duplicate meeting(s) from database", file=sys.stderr)
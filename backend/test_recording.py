@@ -17,8 +17,8 @@ def main():
 
     # Get devices
     print("Detecting audio devices...")
-    manager = DeviceManager()
-    devices = manager.list_all_devices()
+    with DeviceManager() as manager:
+        devices = manager.list_all_devices()
 
     # Display available devices
     print("\n--- Available Input Devices (Microphones) ---")
@@ -26,3 +26,15 @@ def test_load_track_segment_bytes_concatenates(tmp_path):
     a.write_bytes(b"\x01\x02")
     b.write_bytes(b"\x03\x04")
     assert load_track_segment_bytes(tmp_path, ["a.pcm.part", "b.pcm.part"]) == b"\x01\x02\x03\x04"
+
+
+def test_load_track_segment_bytes_fills_one_buffer_across_empty_segments(tmp_path):
+    (tmp_path / "a.pcm.part").write_bytes(b"\x01\x02\x03")
+    (tmp_path / "empty.pcm.part").write_bytes(b"")
+    (tmp_path / "c.pcm.part").write_bytes(b"\x04")
+
+    payload = load_track_segment_bytes(tmp_path, ["a.pcm.part", "empty.pcm.part", "c.pcm.part"])
+
+    assert isinstance(payload, bytearray)
+    assert payload == b"\x01\x02\x03\x04"
+    assert load_track_segment_bytes(tmp_path, []) == b""
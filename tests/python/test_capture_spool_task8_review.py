@@ -19,6 +19,7 @@ _fake_pyaudio.paContinue = 0
 _fake_pyaudio.paComplete = 1
 sys.modules.setdefault("pyaudiowpatch", _fake_pyaudio)
 
+from backend.audio.processor import peak_abs
 from backend.audio.timeline import reconstruct_desktop_timeline
 from backend.audio.swift_audio_capture import SwiftAudioCapture
 from backend.audio.capture_spool_runtime import load_track_pcm_array, load_track_segment_bytes
@@ -222,6 +223,12 @@ def test_windows_manual_cli_stops_and_closes_spools_before_failure_json(tmp_path
             fake.is_recording = False
 
     monkeypatch.setattr(windows_mod.time, "sleep", fake_sleep)
+    # The level loop paces itself with stop_event.wait(); route it through fake_sleep.
+    monkeypatch.setattr(
+        windows_mod.threading.Event,
+        "wait",
+        lambda self, timeout=None: fake_sleep(timeout) or self.is_set(),
+    )
     monkeypatch.setattr(windows_mod, "_send_json_message", lambda payload: results.append(payload))
     monkeypatch.setattr(windows_mod, "_send_error_message", lambda *a, **k: None)
     monkeypatch.setattr(
@@ -270,6 +277,7 @@ def test_windows_fixed_duration_cli_reports_failure_on_async_error(tmp_path, mon
     monkeypatch.setattr(signal_mod, "signal", lambda *a, **k: None)
     monkeypatch.setattr(windows_mod.threading.Thread, "start", lambda self: None)
     monkeypatch.setattr(windows_mod.time, "sleep", lambda s: None)
+    monkeypatch.setattr(windows_mod.threading.Event, "wait", lambda self, timeout=None: self.is_set())
     monkeypatch.setattr(windows_mod, "_send_json_message", lambda p: results.append(p))
     monkeypatch.setattr(windows_mod, "_send_error_message", lambda *a, **k: None)
     monkeypatch.setattr(
@@ -474,6 +482,12 @@ def test_macos_fixed_duration_exits_promptly_on_async_error(monkeypatch):
         lambda: [{"name": "mic", "max_input_channels": 1}],
     )
     monkeypatch.setattr(macos_mod.time, "sleep", fake_sleep)
+    # Duration ticks use stop_event.wait(1); count them like sleeps.
+    monkeypatch.setattr(
+        macos_mod.threading.Event,
+        "wait",
+        lambda self, timeout=None: fake_sleep(timeout) or self.is_set(),
+    )
     monkeypatch.setattr(macos_mod, "_send_json_message", lambda *a, **k: None)
     monkeypatch.setattr(macos_mod, "_send_error_message", lambda *a, **k: None)
     monkeypatch.setattr(macos_mod, "_send_event_message", lambda *a, **k: None)
@@ -724,15 +738,15 @@ def test_windows_start_recording_opens_spools_after_sample_rate_fallback(tmp_pat
             return FakeStream(rate)
 
         def get_device_info_by_index(self, index):
-            assert index == 0
-            return {"defaultSampleRate": 44100.0}
+            raise AssertionError("start_recording must reuse the cached default rate")
 
     recorder = windows_mod.AudioRecorder.__new__(windows_mod.AudioRecorder)
     recorder.output_path = str(tmp_path / "meeting.opus")
     recorder.mic_device_id = 0
     recorder.loopback_device_id = 1
     recorder.mic_sample_rate = 48000
-    recorder.mic_requested_higher_rate = True
+    recorder.mic_requested_target_rate = True
+    recorder.mic_default_sample_rate = 44100
     recorder.mic_channels = 2
     recorder.loopback_sample_rate = 48000
     recorder.loopback_channels = 2
@@ -743,6 +757,7 @@ def test_windows_start_recording_opens_spools_after_sample_rate_fallback(tmp_pat
     recorder.is_windows = False
     recorder.pa = FakePa()
     recorder.lock = threading.Lock()
+    recorder._status_lock = threading.Lock()
     recorder.mic_stream = None
     recorder.desktop_stream = None
     recorder.callback_watchdog = None
@@ -878,3 +893,83 @@ def test_windows_deferred_desktop_wait_bound_hard_fails(tmp_path):
     err = recorder.get_async_capture_error()
     assert err and "Microphone capture did not start" in err
     recorder._release_capture_spools()
+
+
+def test_windows_level_meter_matches_subsampled_peak_including_partial_tail():
+    factor = windows_mod.LEVEL_SUBSAMPLE_FACTOR
+    samples = np.zeros(factor * 5 + 3, dtype=np.int16)
+    samples[factor * 5] = -32768  # lands in the trailing partial stride
+    samples[1] = 32767  # skipped by subsampling
+
+    level = windows_mod._int16_buffer_level(samples.tobytes())
+
+    assert level == peak_abs(samples[::factor]) / 32768.0 == 1.0
+    assert windows_mod._int16_buffer_level(b"") == 0.0
+
+
+@pytest.mark.parametrize(
+    "default_rate, expected_rate, requested_target",
+    [(96000, 48000, True), (44100, 48000, True), (48000, 48000, False)],
+)
+def test_windows_mic_requests_target_rate_whenever_default_differs(
+    monkeypatch, tmp_path, default_rate, expected_rate, requested_target
+):
+    class FakePa:
+        def get_device_count(self):
+            return 1
+
+        def get_device_info_by_index(self, index):
+            return {"maxInputChannels": 2, "defaultSampleRate": float(default_rate)}
+
+    monkeypatch.setattr(windows_mod.pyaudio, "PyAudio", FakePa)
+    monkeypatch.setattr(windows_mod, "_send_event_message", lambda *a, **k: None)
+
+    recorder = windows_mod.AudioRecorder(
+        mic_device_id=0,
+        loopback_device_id=-1,
+        output_path=str(tmp_path / "meeting.opus"),
+    )
+
+    assert recorder.mic_sample_rate == expected_rate
+    assert recorder.mic_requested_target_rate is requested_target
+    assert recorder.mic_default_sample_rate == default_rate
+
+
+def test_macos_wait_while_running_wakes_immediately_on_stop():
+    recorder = macos_mod.MacOSAudioRecorder.__new__(macos_mod.MacOSAudioRecorder)
+    recorder.is_running = True
+    recorder._running_lock = threading.Lock()
+    recorder._running_changed = threading.Condition(recorder._running_lock)
+    results = []
+
+    waiter = threading.Thread(target=lambda: results.append(recorder._wait_while_running(30.0)))
+    started = time.monotonic()
+    waiter.start()
+    time.sleep(0.05)
+    recorder._set_running(False)
+    waiter.join(timeout=5.0)
+
+    assert results == [False]
+    assert time.monotonic() - started < 5.0
+    assert recorder._wait_while_running(30.0) is False
+
+
+def test_windows_callback_status_is_aggregated_off_the_realtime_thread(capsys):
+    recorder = windows_mod.AudioRecorder.__new__(windows_mod.AudioRecorder)
+    recorder.is_recording = False
+    recorder.last_mic_callback_time = None
+    recorder._status_lock = threading.Lock()
+    recorder.mic_status_flags = 0
+    recorder.mic_status_callbacks = 0
+    recorder.desktop_status_flags = 0
+    recorder.desktop_status_callbacks = 0
+
+    recorder._mic_callback(b"", 0, None, 0x2)
+    recorder._mic_callback(b"", 0, None, 0x4)
+    assert capsys.readouterr().err == ""
+
+    recorder._report_callback_status()
+    assert capsys.readouterr().err == "Mic status: 6 (2 callback(s))\n"
+
+    recorder._report_callback_status()
+    assert capsys.readouterr().err == ""
@@ -189,3 +189,27 @@ def test_compress_to_opus_passes_explicit_ffmpeg_path(tmp_path, monkeypatch):
     )
     assert result.endswith('.opus')
     assert seen['cmd'][0] == '/custom/bin/ffmpeg'
+
+
+def test_compress_to_opus_skips_resample_at_native_rate_and_pins_channels(tmp_path, monkeypatch):
+    input_path = tmp_path / 'input.wav'
+    output_path = tmp_path / 'meeting.opus'
+    input_path.write_bytes(b'fake wav')
+    seen = []
+
+    def fake_run(cmd, check=True, capture_output=True):
+        seen.append(list(cmd))
+        Path(cmd[-1]).write_bytes(b'opus')
+        return subprocess.CompletedProcess(args=cmd, returncode=0)
+
+    monkeypatch.setattr(compressor.subprocess, 'run', fake_run)
+    monkeypatch.setattr(compressor, 'verify_recording_integrity', lambda *a, **k: True)
+
+    compressor.compress_to_opus(str(input_path), str(output_path), sample_rate=48000, channels=2)
+    compressor.compress_to_opus(str(input_path), str(output_path), sample_rate=16000)
+
+    native, downsampled = seen
+    assert '-ar' not in native
+    assert native[native.index('-ac') + 1] == '2'
+    assert downsampled[downsampled.index('-ar') + 1] == '16000'
+    assert '-ac' not in downsampled
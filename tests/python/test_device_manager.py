@@ -11,3 +11,236 @@ def test_load_audio_backend_raises_structured_error_for_unsupported_platform(mon
         assert 'Unsupported platform' in str(exc)
     else:
         raise AssertionError('Expected DeviceManagerEnvironmentError for unsupported platform')
+
+
+class _FakeWindowsPa:
+    def __init__(self, infos):
+        self.infos = infos
+        self.info_calls = 0
+        self.host_api_calls = 0
+
+    def get_device_count(self):
+        return len(self.infos)
+
+    def get_device_info_by_index(self, index):
+        self.info_calls += 1
+        return self.infos[index]
+
+    def get_host_api_count(self):
+        return 2
+
+    def get_host_api_info_by_index(self, index):
+        self.host_api_calls += 1
+        return {'name': ['MME', 'Windows WASAPI'][index]}
+
+    def terminate(self):
+        pass
+
+
+def _windows_manager(monkeypatch, infos):
+    monkeypatch.setattr(device_manager, 'IS_WINDOWS', True)
+    monkeypatch.setattr(device_manager, 'IS_MACOS', False)
+    manager = device_manager.DeviceManager.__new__(device_manager.DeviceManager)
+    manager.pa = _FakeWindowsPa(infos)
+    manager._device_snapshot = None
+    return manager
+
+
+def test_windows_pyaudio_handle_opens_on_first_use(monkeypatch):
+    from types import SimpleNamespace
+
+    opened = []
+
+    def open_pa():
+        opened.append(_FakeWindowsPa([]))
+        return opened[-1]
+
+    monkeypatch.setattr(device_manager, 'IS_WINDOWS', True)
+    monkeypatch.setattr(device_manager, 'IS_MACOS', False)
+    monkeypatch.setattr(device_manager, 'pyaudio', SimpleNamespace(PyAudio=open_pa))
+
+    manager = device_manager.DeviceManager()
+    assert opened == []
+
+    assert manager.pa is manager.pa
+    assert len(opened) == 1
+
+
+def test_device_manager_context_terminates_pyaudio_once(monkeypatch):
+    terminated = []
+    manager = _windows_manager(monkeypatch, [])
+    manager.pa.terminate = lambda: terminated.append(True)
+
+    with manager as entered:
+        assert entered is manager
+        manager.pa.get_device_count()
+
+    manager.close()
+    assert terminated == [True]
+    assert manager._pa is None
+
+
+def test_list_all_devices_reuses_enumeration_until_closed(monkeypatch):
+    manager = _windows_manager(
+        monkeypatch,
+        [
+            {'name': 'Mic', 'maxInputChannels': 1, 'defaultSampleRate': 48000.0, 'hostApi': 0},
+            {'name': 'Speakers', 'maxOutputChannels': 2, 'defaultSampleRate': 48000.0, 'hostApi': 0},
+        ],
+    )
+
+    first = manager.list_all_devices()
+    second = manager.list_all_devices()
+
+    assert first == second
+    assert [device['name'] for device in first['input_devices']] == ['Mic']
+    assert manager.pa.info_calls == 2
+
+    manager.close()
+    manager.pa = _FakeWindowsPa(
+        [{'name': 'Headset', 'maxInputChannels': 1, 'defaultSampleRate': 16000.0, 'hostApi': 0}]
+    )
+    refreshed = manager.list_all_devices()
+    assert [device['name'] for device in refreshed['input_devices']] == ['Headset']
+    assert manager.pa.info_calls == 1
+
+
+def test_windows_listing_names_each_host_api_once(monkeypatch):
+    manager = _windows_manager(
+        monkeypatch,
+        [
+            {'name': f'Mic {i}', 'maxInputChannels': 1, 'defaultSampleRate': 48000.0, 'hostApi': i % 2}
+            for i in range(6)
+        ],
+    )
+
+    devices = manager.list_all_devices()['input_devices']
+
+    assert manager.pa.host_api_calls == 2
+    assert [device['host_api'] for device in devices[:2]] == ['MME', 'Windows WASAPI']
+
+
+def test_windows_dedupe_prefers_wasapi_over_higher_rate_mme(monkeypatch):
+    manager = _windows_manager(
+        monkeypatch,
+        [
+            {'name': 'Mic', 'maxInputChannels': 1, 'defaultSampleRate': 96000.0, 'hostApi': 0},
+            {'name': 'Mic', 'maxInputChannels': 1, 'defaultSampleRate': 48000.0, 'hostApi': 1},
+            {'name': 'Mic', 'maxOutputChannels': 2, 'defaultSampleRate': 48000.0, 'hostApi': 0},
+        ],
+    )
+
+    devices = manager.list_all_devices()
+
+    assert [(d['id'], d['host_api']) for d in devices['input_devices']] == [(1, 'Windows WASAPI')]
+    assert [d['id'] for d in devices['output_devices']] == [2]
+    assert devices['loopback_devices'] == []
+
+
+def test_macos_default_devices_come_from_portaudio_indices(monkeypatch):
+    from types import SimpleNamespace
+
+    def no_enumeration(*args, **kwargs):
+        raise AssertionError('default lookup must not enumerate devices')
+
+    monkeypatch.setattr(device_manager, 'IS_WINDOWS', False)
+    monkeypatch.setattr(device_manager, 'IS_MACOS', True)
+    monkeypatch.setattr(
+        device_manager,
+        'sd',
+        SimpleNamespace(default=SimpleNamespace(device=(3, -1)), query_devices=no_enumeration),
+    )
+    manager = device_manager.DeviceManager.__new__(device_manager.DeviceManager)
+
+    assert manager.get_default_devices() == {'default_input': 3, 'default_output': -1}
+
+
+def test_macos_dual_role_device_gets_one_record_per_role(monkeypatch):
+    from types import SimpleNamespace
+
+    devices = [
+        {'name': 'Headset', 'max_input_channels': 1, 'max_output_channels': 2,
+         'default_samplerate': 48000.0, 'hostapi': 0},
+        {'name': 'Speakers', 'max_input_channels': 0, 'max_output_channels': 2,
+         'default_samplerate': 44100.0, 'hostapi': 0},
+    ]
+    monkeypatch.setattr(device_manager, 'IS_WINDOWS', False)
+    monkeypatch.setattr(device_manager, 'IS_MACOS', True)
+    monkeypatch.setattr(
+        device_manager,
+        'sd',
+        SimpleNamespace(query_devices=lambda: devices, query_hostapis=lambda: [{'name': 'Core Audio'}]),
+    )
+    manager = device_manager.DeviceManager.__new__(device_manager.DeviceManager)
+    manager._device_snapshot = None
+
+    listing = manager.list_all_devices()
+
+    assert [(d['id'], d['channels']) for d in listing['input_devices']] == [(0, 1)]
+    assert [(d['name'], d['channels']) for d in listing['output_devices']] == [('Headset', 2), ('Speakers', 2)]
+    assert listing['input_devices'][0] is not listing['output_devices'][0]
+
+
+def test_main_writes_devices_and_defaults_as_one_json_line(monkeypatch, capsys):
+    import json
+    from types import SimpleNamespace
+
+    infos = [
+        {'name': 'Mic', 'maxInputChannels': 1, 'defaultSampleRate': 48000.0, 'hostApi': 1},
+        {'name': 'Speakers', 'maxOutputChannels': 2, 'defaultSampleRate': 48000.0, 'hostApi': 1},
+    ]
+    monkeypatch.setattr(device_manager, 'IS_WINDOWS', True)
+    monkeypatch.setattr(device_manager, 'IS_MACOS', False)
+    monkeypatch.setattr(device_manager, 'pyaudio', SimpleNamespace(PyAudio=lambda: _FakeWindowsPa(infos)))
+
+    device_manager.main()
+
+    output = capsys.readouterr().out
+    assert output.count('\n') == 1
+    payload = json.loads(output)
+    assert [d['name'] for d in payload['input_devices']] == ['Mic']
+    assert [d['name'] for d in payload['output_devices']] == ['Speakers']
+    assert payload['loopback_devices'] == []
+    assert payload['defaults'] == {'default_input': -1, 'default_output': -1}
+
+
+def test_macos_listing_and_validation_share_one_enumeration(monkeypatch):
+    from types import SimpleNamespace
+
+    enumerations = []
+    devices = [
+        {'name': 'Mic', 'max_input_channels': 1, 'max_output_channels': 0,
+         'default_samplerate': 48000.0, 'hostapi': 0},
+        {'name': 'Speakers', 'max_input_channels': 0, 'max_output_channels': 2,
+         'default_samplerate': 48000.0, 'hostapi': 0},
+    ]
+
+    def query_devices():
+        enumerations.append(True)
+        return devices
+
+    monkeypatch.setattr(device_manager, 'IS_WINDOWS', False)
+    monkeypatch.setattr(device_manager, 'IS_MACOS', True)
+    monkeypatch.setattr(
+        device_manager,
+        'sd',
+        SimpleNamespace(
+            query_devices=query_devices,
+            query_hostapis=lambda: [{'name': 'Core Audio'}],
+            default=SimpleNamespace(device=(0, 1)),
+        ),
+    )
+    manager = device_manager.DeviceManager.__new__(device_manager.DeviceManager)
+    manager._device_snapshot = None
+
+    manager.list_all_devices()
+    manager.get_default_devices()
+    manager.validate_input_device(0)
+    try:
+        manager.validate_input_device(1)
+    except ValueError as exc:
+        assert 'no input channels' in str(exc)
+    else:
+        raise AssertionError('Expected ValueError for an output-only device')
+
+    assert len(enumerations) == 1
@@ -189,6 +189,29 @@ def test_add_meeting_saves_metadata_before_removing_originals(tmp_path, monkeypa
     assert Path(meeting['transcriptPath']).exists()
 
 
+def test_add_meeting_keeps_saved_audio_independent_of_unremovable_original(tmp_path, monkeypatch):
+    recordings_dir = tmp_path / 'recordings'
+    source_audio, source_transcript = _create_source_files(recordings_dir, 'locked_recording')
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+    real_unlink = Path.unlink
+
+    def refuse_source_unlink(path, *args, **kwargs):
+        if path in (source_audio, source_transcript):
+            raise PermissionError('file in use')
+        return real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, 'unlink', refuse_source_unlink)
+
+    meeting = manager.add_meeting(
+        audio_path=str(source_audio),
+        transcript_path=str(source_transcript),
+        duration=5.0,
+    )
+    source_audio.write_bytes(b'next-recording')
+
+    assert Path(meeting['audioPath']).read_bytes() == b'audio-bytes'
+
+
 def test_add_meeting_generates_unique_suffix_for_same_second(tmp_path, monkeypatch):
     fixed_now = real_datetime(2026, 1, 7, 10, 45, 55)
 
@@ -1202,3 +1225,130 @@ def test_save_after_corrupt_metadata_preserves_backup_and_writes_new_file(tmp_pa
     assert len(backups) == 1
     assert backups[0].read_text(encoding='utf-8') == '{not valid json'
     assert saved[0]['id'] == meeting['id']
+
+
+def test_save_meetings_writes_one_meeting_per_line(tmp_path):
+    recordings_dir = tmp_path / 'recordings'
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+    assert json.loads(manager.metadata_file.read_text(encoding='utf-8')) == []
+
+    meetings = [
+        {'id': 'a', 'title': 'Réunion', 'date': '2026-01-02T00:00:00', 'ai': {'summary': {'status': 'completed'}}},
+        {'id': 'b', 'title': 'Standup', 'date': '2026-01-01T00:00:00'},
+    ]
+    manager._save_meetings(meetings)
+
+    text = manager.metadata_file.read_text(encoding='utf-8')
+    lines = text.splitlines()
+    assert lines[0] == '[' and lines[-1] == ']'
+    assert len(lines) == 4
+    assert 'Réunion' in lines[1]
+    assert json.loads(text) == meetings
+
+
+def test_save_meetings_syncs_temp_file_data_before_replace(tmp_path, monkeypatch):
+    recordings_dir = tmp_path / 'recordings'
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+    calls = []
+    real_replace = meeting_manager_module.os.replace
+
+    monkeypatch.setattr(meeting_manager_module.os, 'fdatasync', lambda fd: calls.append('fdatasync'), raising=False)
+    monkeypatch.setattr(
+        meeting_manager_module.os,
+        'replace',
+        lambda src, dst: (calls.append('replace'), real_replace(src, dst)),
+    )
+
+    manager._save_meetings([{'id': 'a', 'title': 'A', 'date': '2026-01-01T00:00:00'}])
+
+    assert calls == ['fdatasync', 'replace']
+    assert [m['id'] for m in json.loads(manager.metadata_file.read_text(encoding='utf-8'))] == ['a']
+
+
+def test_cli_prints_compact_json_unless_pretty_requested(tmp_path, monkeypatch, capsys):
+    recordings_dir = tmp_path / 'recordings'
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+    manager._save_meetings([{'id': 'a', 'title': 'A', 'date': '2026-01-01T00:00:00'}])
+
+    monkeypatch.setattr(meeting_manager_module.sys, 'argv', ['meeting_manager.py', '--recordings-dir', str(recordings_dir), 'list'])
+    meeting_manager_module.main()
+    compact = capsys.readouterr().out
+    assert compact.count('\n') == 1
+    assert [m['id'] for m in json.loads(compact)] == ['a']
+
+    monkeypatch.setattr(
+        meeting_manager_module.sys,
+        'argv',
+        ['meeting_manager.py', '--recordings-dir', str(recordings_dir), '--pretty', 'list'],
+    )
+    meeting_manager_module.main()
+    pretty = capsys.readouterr().out
+    assert pretty.count('\n') > 1
+    assert json.loads(pretty) == json.loads(compact)
+
+
+def test_scan_and_sync_recordings_saves_metadata_once_for_many_imports(tmp_path, monkeypatch):
+    recordings_dir = tmp_path / 'recordings'
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+
+    for stem in ['meeting_20250101_120000', 'meeting_20250102_120000', 'meeting_20250103_120000']:
+        (recordings_dir / f'{stem}.opus').write_bytes(b'audio')
+        (recordings_dir / f'{stem}.md').write_text('**Duration:** 0:05\n\nText', encoding='utf-8')
+
+    saves = []
+    original_save = manager._save_meetings_unlocked
+
+    def counting_save(meetings):
+        saves.append(len(meetings))
+        original_save(meetings)
+
+    monkeypatch.setattr(manager, '_save_meetings_unlocked', counting_save)
+
+    result = manager.scan_and_sync_recordings()
+
+    assert result == {'scanned': 3, 'added': 3, 'skipped': 0}
+    assert saves == [3]
+    assert [m['id'] for m in manager.list_meetings()] == [
+        '20250103_120000',
+        '20250102_120000',
+        '20250101_120000',
+    ]
+    assert manager.scan_and_sync_recordings() == {'scanned': 3, 'added': 0, 'skipped': 3}
+    assert saves == [3]
+
+
+def test_scan_and_sync_recordings_skips_second_file_mapping_to_same_id(tmp_path):
+    recordings_dir = tmp_path / 'recordings'
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+
+    for stem in ['meeting_20250101_120000', 'recording_2025-01-01T12-00-00']:
+        (recordings_dir / f'{stem}.opus').write_bytes(b'audio')
+        (recordings_dir / f'{stem}.md').write_text('**Duration:** 0:05\n\nText', encoding='utf-8')
+
+    assert manager.scan_and_sync_recordings() == {'scanned': 2, 'added': 1, 'skipped': 1}
+    meetings = manager.list_meetings()
+    assert [m['id'] for m in meetings] == ['20250101_120000']
+    assert Path(meetings[0]['audioPath']).name == 'meeting_20250101_120000.opus'
+
+
+def test_get_meeting_cleans_duplicate_ids_and_returns_the_first(tmp_path):
+    recordings_dir = tmp_path / 'recordings'
+    manager = MeetingManager(recordings_dir=str(recordings_dir))
+    transcript_path = recordings_dir / 'meeting_a.md'
+    transcript_path.write_text('hello', encoding='utf-8')
+    base = {'transcriptPath': str(transcript_path), 'date': '2026-01-01T00:00:00'}
+    manager._save_meetings([{**base, 'id': 'a', 'title': 'A'}, {**base, 'id': 'b', 'title': 'B'}])
+
+    fetched = manager.get_meeting('a')
+    fetched['title'] = 'Mutated by caller'
+    assert manager.get_meeting('a')['title'] == 'A'
+    assert manager.get_meeting('a')['transcript'] == 'hello'
+    assert manager.get_meeting('missing') is None
+
+    manager.metadata_file.write_text(
+        json.dumps([{**base, 'id': 'a', 'title': 'First'}, {**base, 'id': 'a', 'title': 'Second'}]),
+        encoding='utf-8',
+    )
+    assert manager.get_meeting('a')['title'] == 'First'
+    saved = json.loads(manager.metadata_file.read_text(encoding='utf-8'))
+    assert [m['title'] for m in saved] == ['First']
@@ -101,6 +101,9 @@ class DeviceHelpersTests(unittest.TestCase):
     def test_windows_blocklist_and_dedupe(self):
         self.assertTrue(is_blocked_windows_device_name("Microsoft Sound Mapper - Input"))
         self.assertFalse(is_blocked_windows_device_name("Headset Microphone"))
+        self.assertTrue(is_blocked_windows_device_name("Primary Sound Capture Driver"))
+        self.assertTrue(is_blocked_windows_device_name("Primary Sound Driver"))
+        self.assertFalse(is_blocked_windows_device_name(None))
 
         seen = {}
         low = build_device_record(device_id=1, name="Mic", channels=1, sample_rate=44100, host_api="MME")
@@ -110,6 +113,17 @@ class DeviceHelpersTests(unittest.TestCase):
         self.assertEqual(seen["Mic"]["id"], 2)
         self.assertEqual(seen["Mic"]["sample_rate"], 48000)
 
+    def test_windows_dedupe_prefers_mme_over_wdm_ks_at_same_rate(self):
+        mme = build_device_record(device_id=1, name="Mic", channels=1, sample_rate=48000, host_api="MME")
+        wdm_ks = build_device_record(
+            device_id=2, name="Mic", channels=1, sample_rate=48000, host_api="Windows WDM-KS"
+        )
+        for order in ((mme, wdm_ks), (wdm_ks, mme)):
+            seen = {}
+            for device in order:
+                dedupe_device_by_name(seen, device)
+            self.assertEqual(seen["Mic"]["host_api"], "MME")
+
     def test_macos_virtual_loopback_and_sort(self):
         loopbacks = macos_virtual_loopback_devices()
         self.assertEqual(loopbacks[0]["id"], MACOS_SCREENCAPTURE_LOOPBACK_DEVICE["id"])
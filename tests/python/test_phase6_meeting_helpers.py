@@ -26,6 +26,7 @@ from meetings.paths import (
 )
 from meetings.scan_import import (
     cleanup_orphan_capture_sessions,
+    extract_duration_from_transcript_file,
     extract_duration_seconds_from_transcript,
     parse_scan_meeting_id_and_title,
     recover_or_cleanup_recorder_temps,
@@ -180,6 +181,35 @@ class MeetingScanImportTests(unittest.TestCase):
         self.assertEqual(meeting_id, "20251201_133143")
         self.assertEqual(title, "Meeting 2025-12-01 13:31:43")
 
+    def test_transcript_file_duration_reads_header_before_body(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            transcript = Path(temp_dir) / "meeting_20260107_104555.md"
+            body = "**[00:00:01 - 00:00:02]** words\n" * 50000
+            transcript.write_text(
+                "# Meeting Transcription\n\n**Duration:** 0:12:34\n\n## Transcript\n\n" + body,
+                encoding="utf-8",
+            )
+            with mock.patch(
+                "meetings.scan_import.extract_duration_seconds_from_transcript",
+                wraps=extract_duration_seconds_from_transcript,
+            ) as parse:
+                self.assertEqual(extract_duration_from_transcript_file(transcript), 754.0)
+            self.assertLess(len(parse.call_args.args[0]), 4096 + 64)
+
+            transcript.write_text(body + "**Duration:** 1:00:00\n", encoding="utf-8")
+            self.assertEqual(extract_duration_from_transcript_file(transcript), 3600.0)
+
+    def test_transcript_file_duration_completes_line_cut_by_header_window(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            transcript = Path(temp_dir) / "meeting_20260107_104555.md"
+            duration_line = "**Duration:** 12:34\n"
+            padding = "x" * (4096 - len(duration_line) + 1) + "\n"
+            transcript.write_text(
+                padding + duration_line + "**[00:00:01 - 00:00:02]** words\n" * 1000,
+                encoding="utf-8",
+            )
+            self.assertEqual(extract_duration_from_transcript_file(transcript), 754.0)
+
 
 class MeetingPathsSecurityTests(unittest.TestCase):
     """Direct coverage for paths.py security helpers (review hardening)."""
@@ -6,6 +6,8 @@ from backend.audio.processor import (
     enhance_microphone,
     mix_audio,
     mono_to_stereo,
+    pad_right,
+    peak_abs,
     resample,
 )
 
@@ -69,6 +71,19 @@ def test_mono_to_stereo_duplicates_each_sample():
     )
 
 
+def test_windows_mono_downmix_interleaves_into_float32_frames():
+    from backend.audio.processor import downmix_windows_frames_to_stereo
+
+    mono = np.array([[100], [-200], [300]], dtype=np.int16)
+
+    stereo = downmix_windows_frames_to_stereo(mono, 1)
+
+    assert stereo.dtype == np.float32
+    assert stereo.shape == (3, 2)
+    assert np.array_equal(stereo[:, 0], stereo[:, 1])
+    assert np.array_equal(stereo[:, 0], np.array([100, -200, 300], dtype=np.float32))
+
+
 def test_downmix_to_stereo_uses_first_two_channels():
     audio = np.array(
         [
@@ -93,6 +108,18 @@ def test_align_audio_lengths_pads_shorter_audio_with_silence():
     assert np.array_equal(padded2, audio2)
 
 
+def test_pad_right_zero_fills_frames_and_passes_through_long_input():
+    frames = np.ones((3, 2), dtype=np.float32)
+
+    padded = pad_right(frames, 5)
+
+    assert padded.shape == (5, 2)
+    assert padded.dtype == np.float32
+    assert np.array_equal(padded[:3], frames)
+    assert not padded[3:].any()
+    assert pad_right(frames, 2) is frames
+
+
 def test_mix_audio_stays_within_int16_bounds():
     mic = np.array([32767, 32767], dtype=np.int16)
     desktop = np.array([32767, 32767], dtype=np.int16)
@@ -113,6 +140,18 @@ def test_enhance_microphone_truncates_odd_stereo_input_to_even_length():
     assert len(result) % 2 == 0
 
 
+def test_enhance_microphone_stereo_matches_independent_mono_channels():
+    rng = np.random.default_rng(3)
+    left = (rng.standard_normal(4000) * 3000 + 400).astype(np.int16)
+    right = (rng.standard_normal(4000) * 200 - 50).astype(np.int16)
+    interleaved = np.column_stack([left, right]).reshape(-1)
+
+    result = enhance_microphone(interleaved, sample_rate=48000, target_channels=2).reshape(-1, 2)
+
+    np.testing.assert_array_equal(result[:, 0], enhance_microphone(left, 48000, target_channels=1))
+    np.testing.assert_array_equal(result[:, 1], enhance_microphone(right, 48000, target_channels=1))
+
+
 def test_stateful_resampler_passthrough_and_stereo_shape():
     from backend.audio.processor import StatefulResampler
 
@@ -122,6 +161,27 @@ def test_stateful_resampler_passthrough_and_stereo_shape():
     assert out.shape == (8, 2)
 
 
+def test_stateful_resampler_filters_stereo_channels_independently_across_chunks():
+    from backend.audio.processor import StatefulResampler
+
+    t = np.arange(4800, dtype=np.float32) / 44100.0
+    left = (0.5 * np.sin(2 * np.pi * 440.0 * t)).astype(np.float32)
+    frames = np.column_stack([left, np.zeros_like(left)])
+
+    stream = StatefulResampler(44100, 48000, 2)
+    out = np.concatenate(
+        [stream.process(frames[:1000]), stream.process(frames[1000:], last=True)]
+    )
+    mono = StatefulResampler(44100, 48000, 1)
+    expected_left = np.concatenate(
+        [mono.process(left[:1000]), mono.process(left[1000:], last=True)]
+    )
+
+    assert out.shape == (expected_left.shape[0], 2)
+    np.testing.assert_array_equal(out[:, 0], expected_left)
+    assert not np.any(out[:, 1])
+
+
 def test_downmix_helpers_reject_misaligned_lengths():
     from backend.audio.processor import downmix_windows_frames_to_stereo
 
@@ -148,3 +208,79 @@ def test_channel_enhance_plan_matches_inplace_process():
     apply_channel_enhance_inplace(planned, plan)
     _process_channel_inplace(reference)
     assert np.allclose(planned, reference, atol=1e-6)
+
+
+def test_soft_limit_inplace_matches_tanh_curve_on_strided_view():
+    from backend.audio.processor import soft_limit_inplace
+
+    rng = np.random.default_rng(3)
+    frames = rng.normal(0.0, 1.5, size=(500, 2)).astype(np.float32)
+    expected = np.tanh(frames[:, 1] * 0.9) * 0.85
+
+    soft_limit_inplace(frames[:, 1], pre_gain=0.9, post_gain=0.85)
+
+    assert np.array_equal(frames[:, 1], expected)
+
+
+def test_peak_abs_handles_int16_minimum_strided_views_and_empty_input():
+    audio = np.array([5, -32768, 7, 12], dtype=np.int16)
+
+    assert peak_abs(audio) == 32768.0
+    assert peak_abs(audio[1::2]) == 32768.0
+    assert peak_abs(audio[::2]) == 7.0
+    assert peak_abs(audio[1::2][1:]) == 12.0
+    assert peak_abs(np.array([0.25, -0.5, 0.75], dtype=np.float32)[:2]) == 0.5
+    assert peak_abs(np.zeros(0, dtype=np.float32)) == 0.0
+
+
+def test_process_channel_leaves_input_untouched_and_matches_inplace_path():
+    from backend.audio.processor import _process_channel, _process_channel_inplace
+
+    rng = np.random.default_rng(5)
+    channel = (rng.standard_normal(2048) * 0.6 + 0.05).astype(np.float32)
+    original = channel.copy()
+
+    processed = _process_channel(channel)
+    expected = original.copy()
+    _process_channel_inplace(expected)
+
+    np.testing.assert_array_equal(channel, original)
+    np.testing.assert_array_equal(processed, expected)
+
+
+def test_normalization_gain_derives_limiter_decision_from_scaled_peak():
+    from backend.audio.processor import normalization_gain
+
+    assert normalization_gain(0.0) == (1.0, False)
+    assert normalization_gain(0.5) == (1.0, False)
+    scale, soft_limit = normalization_gain(1.4)
+    assert scale == 0.5 and soft_limit is False
+    scale, soft_limit = normalization_gain(0.05)
+    assert abs(scale - 6.0) < 1e-12 and soft_limit is False
+
+
+def test_float_to_int16_inplace_saturates_instead_of_wrapping():
+    from backend.audio.processor import float_to_int16_inplace
+
+    audio = np.array([0.0, 0.5, 1.5, -2.0, -1.0], dtype=np.float32)
+
+    result = float_to_int16_inplace(audio)
+
+    assert result.dtype == np.int16
+    assert result.tolist() == [0, 16383, 32767, -32767, -32767]
+
+
+def test_int16_to_float32_matches_astype_then_scale_bit_for_bit():
+    from backend.audio.processor import int16_to_float32
+
+    samples = np.array([[-32768, 32767], [1, -1], [12345, -23456]], dtype=np.int16)
+
+    legacy = samples.astype(np.float32)
+    legacy *= 0.8 * 2.0 / 32768.0
+    fused = int16_to_float32(samples, 0.8 * 2.0)
+
+    assert fused.dtype == np.float32
+    np.testing.assert_array_equal(fused, legacy)
+    np.testing.assert_array_equal(
+        int16_to_float32(samples[:, :1]), samples[:, :1].astype(np.float32) / 32768.0
+    )
@@ -223,6 +223,15 @@ def test_structured_message_helpers_emit_expected_stdout_shapes(capsys):
     assert captured.err == ""
 
 
+def test_send_json_message_emits_one_stdlib_encoded_line(capsys):
+    message = {"type": "levels", "mic": 0.1, "desktop": 0.2}
+    recorder_stdout.send_json_message(message)
+
+    captured = capsys.readouterr()
+    assert captured.out == json.dumps(message) + "\n"
+    assert captured.err == ""
+
+
 def test_macos_structured_message_helpers_match_windows_shapes(capsys):
     recorder_stdout.send_event_message("configuring_devices", "Configuring audio devices...")
     captured = capsys.readouterr()
@@ -232,8 +232,55 @@ def test_check_permissions_uses_swift_helper_before_pyobjc(monkeypatch):
     assert error == 'Screen Recording permission not granted'
 
 
+def test_pyobjc_screen_permission_check_returns_once_callback_fires(monkeypatch):
+    import sys
+    import types
+
+    pending = []
+    run_loop_slices = []
+
+    class FakeShareableContent:
+        @staticmethod
+        def getShareableContentWithCompletionHandler_(handler):
+            pending.append(handler)
+
+    def fake_run_in_mode(mode, seconds, return_after_source):
+        run_loop_slices.append(seconds)
+        if len(run_loop_slices) == 3:
+            pending.pop()(object(), None)
+
+    monkeypatch.setitem(
+        sys.modules, 'ScreenCaptureKit', types.SimpleNamespace(SCShareableContent=FakeShareableContent)
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        'CoreFoundation',
+        types.SimpleNamespace(CFRunLoopRunInMode=fake_run_in_mode, kCFRunLoopDefaultMode='default'),
+    )
+    monkeypatch.setattr(check_permissions_module, '_check_screen_recording_permission_with_swift_helper', lambda: None)
+
+    granted, error = check_permissions_module.check_screen_recording_permission()
+
+    assert (granted, error) == (True, '')
+    assert run_loop_slices == [check_permissions_module.SCREEN_RECORDING_RUN_LOOP_SLICE_S] * 3
+
+
+def test_check_permissions_non_darwin_prints_payload_and_exits_zero(monkeypatch, capsys):
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', False)
+    monkeypatch.setattr(check_permissions_module.platform, 'system', lambda: 'Windows')
+    monkeypatch.setattr(check_permissions_module.sys, 'argv', ['check_permissions.py'])
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_permissions_module.main()
+
+    assert exc_info.value.code == 0
+    payload = __import__('json').loads(capsys.readouterr().out)
+    assert payload['platform'] == 'Windows'
+    assert payload['all_granted'] is True
+
+
 def test_check_permissions_can_skip_proactive_screen_recording_check(monkeypatch, capsys):
-    monkeypatch.setattr(check_permissions_module.platform, 'system', lambda: 'Darwin')
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', True)
     monkeypatch.setattr(check_permissions_module, 'check_macos_version_compatibility', lambda: (True, '14.0', None))
     monkeypatch.setattr(check_permissions_module, 'check_microphone_permission', lambda mic_device_id=None: (True, ''))
     monkeypatch.setattr(
@@ -540,7 +587,7 @@ def test_desktop_audio_availability_prefers_swift(monkeypatch):
 
 
 def test_check_permissions_main_exits_nonzero_when_desktop_backend_missing(monkeypatch, capsys):
-    monkeypatch.setattr(check_permissions_module.platform, 'system', lambda: 'Darwin')
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', True)
     monkeypatch.setattr(check_permissions_module, 'check_macos_version_compatibility', lambda: (True, '14.0', None))
     monkeypatch.setattr(check_permissions_module, 'check_microphone_permission', lambda mic_device_id=None: (True, ''))
     monkeypatch.setattr(
@@ -560,7 +607,7 @@ def test_check_permissions_main_exits_nonzero_when_desktop_backend_missing(monke
 
 
 def test_check_permissions_main_exits_zero_when_all_requirements_pass(monkeypatch, capsys):
-    monkeypatch.setattr(check_permissions_module.platform, 'system', lambda: 'Darwin')
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', True)
     monkeypatch.setattr(check_permissions_module, 'check_macos_version_compatibility', lambda: (True, '14.0', None))
     monkeypatch.setattr(check_permissions_module, 'check_microphone_permission', lambda mic_device_id=None: (True, ''))
     monkeypatch.setattr(
@@ -577,3 +624,103 @@ def test_check_permissions_main_exits_zero_when_all_requirements_pass(monkeypatc
     output = capsys.readouterr().out
     assert exc_info.value.code == 0
     assert '"all_granted": true' in output
+    # Electron parses stdout as a single JSON document; keep it on one line.
+    assert output.count('\n') == 1
+
+
+def test_check_permissions_main_overlaps_mic_and_screen_checks(monkeypatch, capsys):
+    import threading
+
+    screen_started = threading.Event()
+    mic_threads = []
+
+    def mic_check(mic_device_id=None):
+        mic_threads.append(threading.current_thread())
+        # Only succeeds if the screen check is running concurrently.
+        return (screen_started.wait(timeout=5.0), '')
+
+    def screen_check():
+        screen_started.set()
+        return (True, '')
+
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', True)
+    monkeypatch.setattr(check_permissions_module, 'check_macos_version_compatibility', lambda: (True, '14.0', None))
+    monkeypatch.setattr(check_permissions_module, 'check_microphone_permission', mic_check)
+    monkeypatch.setattr(
+        check_permissions_module,
+        'check_desktop_audio_capture_availability',
+        lambda: (True, 'swift', ''),
+    )
+    monkeypatch.setattr(check_permissions_module, 'check_screen_recording_permission', screen_check)
+    monkeypatch.setattr(check_permissions_module.sys, 'argv', ['check_permissions.py'])
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_permissions_module.main()
+
+    assert exc_info.value.code == 0
+    assert '"all_granted": true' in capsys.readouterr().out
+    assert mic_threads and mic_threads[0] is not threading.main_thread()
+
+
+def test_check_permissions_main_shuts_mic_worker_down_when_a_check_raises(monkeypatch):
+    shutdowns = []
+
+    class RecordingPool(check_permissions_module.ThreadPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            shutdowns.append(True)
+            return super().shutdown(*args, **kwargs)
+
+    def broken_desktop_check():
+        raise RuntimeError('desktop check failed')
+
+    monkeypatch.setattr(check_permissions_module, 'ThreadPoolExecutor', RecordingPool)
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', True)
+    monkeypatch.setattr(check_permissions_module, 'check_macos_version_compatibility', lambda: (True, '14.0', None))
+    monkeypatch.setattr(check_permissions_module, 'check_microphone_permission', lambda mic_device_id=None: (True, ''))
+    monkeypatch.setattr(check_permissions_module, 'check_desktop_audio_capture_availability', broken_desktop_check)
+    monkeypatch.setattr(check_permissions_module.sys, 'argv', ['check_permissions.py'])
+
+    with pytest.raises(RuntimeError, match='desktop check failed'):
+        check_permissions_module.main()
+
+    assert shutdowns == [True]
+
+
+def test_check_permissions_probes_microphone_on_every_run(monkeypatch):
+    calls = []
+
+    monkeypatch.setattr(check_permissions_module, 'IS_MACOS', True)
+    monkeypatch.setattr(check_permissions_module, 'check_macos_version_compatibility', lambda: (True, '14.0', None))
+    monkeypatch.setattr(
+        check_permissions_module,
+        'check_microphone_permission',
+        lambda mic_device_id=None: calls.append(mic_device_id) or (True, ''),
+    )
+    monkeypatch.setattr(check_permissions_module, 'check_desktop_audio_capture_availability', lambda: (True, 'swift', ''))
+    monkeypatch.setattr(check_permissions_module.sys, 'argv', ['check_permissions.py', '--skip-screen-recording-check'])
+
+    for _ in range(2):
+        with pytest.raises(SystemExit) as exc_info:
+            check_permissions_module.main()
+        assert exc_info.value.code == 0
+
+    # A granted result is never reused: permissions can be revoked and device
+    # indices shift between runs.
+    assert calls == [None, None]
+
+
+def test_get_macos_version_reads_platform_once(monkeypatch):
+    calls = []
+
+    def fake_mac_ver():
+        calls.append(True)
+        return ('14.2.1', ('', '', ''), 'arm64')
+
+    monkeypatch.setattr(check_permissions_module.platform, 'mac_ver', fake_mac_ver)
+    check_permissions_module.get_macos_version.cache_clear()
+    try:
+        assert check_permissions_module.get_macos_version() == (14, 2)
+        assert check_permissions_module.check_macos_version_compatibility()[:2] == (True, '14.2')
+        assert len(calls) == 1
+    finally:
+        check_permissions_module.get_macos_version.cache_clear()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import wave
 from pathlib import Path
 
@@ -203,6 +204,30 @@ def test_stateful_resampler_matches_whole_array_quality():
     assert float(np.mean(np.abs(streamed[:n] - oneshot[:n]))) < 1e-5
 
 
+def test_windows_normalize_resamples_only_front_pair_of_multichannel_mic(tmp_path):
+    rng = np.random.default_rng(11)
+    mic = (rng.standard_normal((44100, 6)) * 4000).astype(np.int16)
+    coordinator, _ = _build_session(
+        tmp_path, profile="windows-v1", mic=mic, desktop=None, mic_rate=44100, include_desktop=False
+    )
+
+    written, _ = spp._normalize_track_to_stereo_file(
+        session_dir=coordinator.session_dir,
+        track=coordinator.get_track("mic"),
+        profile="windows-v1",
+        output_name="normalized.f32",
+        chunk_frames=4096,
+    )
+
+    stream = StatefulResampler(44100, 48000, 6, quality="VHQ")
+    chunks = [stream.process(mic[i : i + 4096].astype(np.float32) / 32768.0) for i in range(0, len(mic), 4096)]
+    chunks.append(stream.process(np.zeros((0, 6), dtype=np.float32), last=True))
+    expected = downmix_windows_frames_to_stereo(np.concatenate(chunks), 6)
+    produced = np.fromfile(coordinator.session_dir / "normalized.f32", dtype=np.float32).reshape(-1, 2)
+    assert written == produced.shape[0]
+    np.testing.assert_array_equal(produced, expected)
+
+
 def test_windows_downmix_selects_front_pair():
     frames = np.arange(12, dtype=np.float32).reshape(2, 6)
     stereo = downmix_windows_frames_to_stereo(frames, 6)
@@ -343,6 +368,39 @@ def test_macos_v1_fixture_equivalence(tmp_path, name, builder, monkeypatch):
     assert float(np.max(np.abs(got.astype(np.int32)))) <= 32767
 
 
+@pytest.mark.parametrize("level, expected_passes", [(0.2, 2), (0.9, 3)])
+def test_macos_v1_reuses_peak_pass_stats_unless_mix_is_limited(
+    tmp_path, monkeypatch, level, expected_passes
+):
+    rng = np.random.default_rng(21)
+    mic = (rng.standard_normal((3000, 2)) * level / 3).astype(np.float32)
+    desk = (rng.standard_normal((3000, 2)) * level / 3).astype(np.float32)
+    ref = reference_macos_v1_process(mic, desk, mic_channels=2, desktop_channels=2)
+    coordinator, output = _build_session(
+        tmp_path, profile="macos-v1", mic=mic, desktop=desk, dtype="<f4"
+    )
+    _patch_finalize_io(monkeypatch)
+    passes = {"n": 0}
+    real_iter = spp._iter_aligned_mix_chunks
+
+    def counting_iter(**kwargs):
+        passes["n"] += 1
+        return real_iter(**kwargs)
+
+    monkeypatch.setattr(spp, "_iter_aligned_mix_chunks", counting_iter)
+
+    result = finalize_capture(
+        coordinator.session_dir / MANIFEST_FILENAME,
+        output,
+        ffmpeg_path="ffmpeg",
+        chunk_frames=512,
+        coordinator=coordinator,
+    )
+
+    assert passes["n"] == expected_passes
+    assert _mae_int16(_read_wav_int16(Path(result.final_path)), ref) <= 2.0
+
+
 def test_macos_v1_initial_offset_alignment_equivalence(tmp_path, monkeypatch):
     mic = np.full((2000, 2), 0.1, dtype=np.float32)
     desk = np.full((1800, 2), 0.05, dtype=np.float32)
@@ -768,6 +826,20 @@ def test_stats_enhance_plan_matches_at_float32_threshold_boundaries(threshold):
             assert got.soft_limit is want.soft_limit
 
 
+def test_mix_chunk_inplace_matches_expression_mix():
+    rng = np.random.default_rng(5)
+    mic = rng.normal(0.0, 0.4, size=(257, 2)).astype(np.float32)
+    desk = rng.normal(0.0, 0.4, size=(257, 2)).astype(np.float32)
+    expected = mic * np.float32(2.0) + desk * np.float32(0.8)
+    spp._mix_soft_limit_inplace(expected, apply=True)
+
+    got = spp._mix_chunk_inplace(
+        mic.copy(), desk.copy(), mic_gain=2.0, desktop_gain=0.8, apply_limit=True
+    )
+
+    assert np.array_equal(got, expected)
+
+
 def test_aligned_mix_opens_each_normalized_input_once_per_pass(tmp_path, monkeypatch):
     from backend.audio.streaming_post_processor import _OneSidedDecision
 
@@ -811,6 +883,84 @@ def test_aligned_mix_opens_each_normalized_input_once_per_pass(tmp_path, monkeyp
     assert open_counts == {mic_path: 1, desk_path: 1}
 
 
+def test_aligned_mix_reused_desktop_scratch_keeps_pad_and_tail_silent(tmp_path):
+    from backend.audio.streaming_post_processor import _OneSidedDecision
+
+    mic_path = tmp_path / "mic.f32"
+    desk_path = tmp_path / "desk.f32"
+    spp._write_float32_chunk(mic_path, np.full((65, 2), 0.1, dtype=np.float32), append=False)
+    desk = np.arange(40, dtype=np.float32).reshape(20, 2) / 100.0
+    spp._write_float32_chunk(desk_path, desk, append=False)
+
+    mixed = np.concatenate(
+        list(
+            spp._iter_aligned_mix_chunks(
+                mic_path=mic_path,
+                desk_path=desk_path,
+                mic_frames=65,
+                desk_frames=20,
+                total_frames=65,
+                chunk_frames=16,
+                mic_pad=0,
+                desk_pad=10,
+                desk_trim=0,
+                include_desktop=True,
+                profile="macos-v1",
+                mic_volume=1.0,
+                desktop_volume=1.0,
+                mic_boost=1.0,
+                mic_one_sided=_OneSidedDecision(False),
+                desk_one_sided=_OneSidedDecision(False),
+                mic_enhance=None,
+                apply_mix_limit=False,
+            )
+        )
+    )
+
+    expected = np.full((65, 2), 0.1, dtype=np.float32)
+    expected[10:30] += desk
+    np.testing.assert_array_equal(mixed, expected)
+
+
+@pytest.mark.parametrize("mic_volume", [1.0, 0.5])
+def test_macos_mic_only_aligned_mix_scales_by_volume_in_place(tmp_path, mic_volume):
+    from backend.audio.streaming_post_processor import _OneSidedDecision
+
+    mic_path = tmp_path / "mic.f32"
+    mic = np.linspace(-0.9, 0.9, 40, dtype=np.float32).reshape(20, 2)
+    spp._write_float32_chunk(mic_path, mic, append=False)
+
+    mixed = np.concatenate(
+        list(
+            spp._iter_aligned_mix_chunks(
+                mic_path=mic_path,
+                desk_path=None,
+                mic_frames=20,
+                desk_frames=0,
+                total_frames=24,
+                chunk_frames=8,
+                mic_pad=4,
+                desk_pad=0,
+                desk_trim=0,
+                include_desktop=False,
+                profile="macos-v1",
+                mic_volume=mic_volume,
+                desktop_volume=1.0,
+                mic_boost=1.0,
+                mic_one_sided=_OneSidedDecision(False),
+                desk_one_sided=_OneSidedDecision(False),
+                mic_enhance=None,
+                apply_mix_limit=False,
+            )
+        )
+    )
+
+    expected = np.zeros((24, 2), dtype=np.float32)
+    expected[4:] = mic * np.float32(mic_volume)
+    assert mixed.dtype == np.float32
+    np.testing.assert_array_equal(mixed, expected)
+
+
 def test_windows_aligned_frame_count_caps_at_mic():
     from audio.streaming_post_processor import _aligned_frame_count
 
@@ -877,3 +1027,48 @@ def test_expected_output_duration_windows_caps_at_mic():
 
     data["processingProfile"] = "macos-v1"
     assert expected_output_duration_seconds(data) == 120.0
+
+
+def _fake_ffmpeg_script(tmp_path, body):
+    script = tmp_path / "fake_ffmpeg"
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}\n", encoding="utf-8")
+    script.chmod(0o755)
+    return str(script)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang fake ffmpeg")
+def test_stream_final_wav_pipe_writer_preserves_chunk_order_past_queue_bound(tmp_path):
+    ffmpeg = _fake_ffmpeg_script(
+        tmp_path,
+        "data = sys.stdin.buffer.read()\nopen(sys.argv[-1], 'wb').write(data)",
+    )
+    frames = [
+        np.full((64, 2), float(index), dtype=np.float32)
+        for index in range(spp._FFMPEG_PIPE_QUEUE_CHUNKS * 3)
+    ]
+    out = tmp_path / "piped.raw"
+
+    written = _stream_final_wav_via_ffmpeg(
+        ffmpeg_path=ffmpeg, output_path=out, frame_iter=iter(frames)
+    )
+
+    assert written == 64 * len(frames)
+    piped = np.frombuffer(out.read_bytes(), dtype=np.float32).reshape(-1, 2)
+    np.testing.assert_array_equal(piped, np.concatenate(frames))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang fake ffmpeg")
+def test_stream_final_wav_pipe_writer_surfaces_broken_pipe(tmp_path):
+    ffmpeg = _fake_ffmpeg_script(tmp_path, "sys.exit(1)")
+    consumed = []
+
+    def frames():
+        for index in range(200):
+            consumed.append(index)
+            yield np.zeros((48000, 2), dtype=np.float32)
+
+    with pytest.raises(OSError):
+        _stream_final_wav_via_ffmpeg(
+            ffmpeg_path=ffmpeg, output_path=tmp_path / "never.wav", frame_iter=frames()
+        )
+    assert len(consumed) < 200
@@ -54,3 +54,20 @@ def test_probe_wav_pcm_geometry_reads_standard_wav(tmp_path):
         "sample_width": 2,
         "frames": 3,
     }
+
+
+def test_write_float_stereo_wav_streams_blocks_with_exact_frame_count(tmp_path, monkeypatch):
+    import backend.audio.wav_io as wav_io
+
+    monkeypatch.setattr(wav_io, "_WAV_WRITE_BLOCK_FRAMES", 4)
+    path = tmp_path / "blocks.wav"
+    audio = np.linspace(-1.0, 1.0, 22, dtype=np.float32).reshape(-1, 2)
+
+    write_float_stereo_wav(path, audio, sample_rate=48000, log=False)
+
+    with wave.open(str(path), "rb") as wf:
+        assert wf.getnframes() == 11
+        frames = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16).reshape(-1, 2)
+
+    expected = np.clip(audio * 32767, -32768, 32767).astype(np.int16)
+    np.testing.assert_array_equal(frames, expected)